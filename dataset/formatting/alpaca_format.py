@@ -15,6 +15,8 @@ from pathlib import Path
 
 import click
 
+from dataset.generators.base import jsonl_files, open_jsonl
+
 
 def convert_to_alpaca(input_path: Path, output_path: Path) -> int:
     """Convert JSONL dataset to Alpaca format.
@@ -28,13 +30,8 @@ def convert_to_alpaca(input_path: Path, output_path: Path) -> int:
     """
     examples = []
 
-    if input_path.is_dir():
-        files = sorted(input_path.glob("*.jsonl"))
-    else:
-        files = [input_path]
-
-    for f in files:
-        with open(f) as fh:
+    for f in jsonl_files(input_path):
+        with open_jsonl(f) as fh:
             for line in fh:
                 data = json.loads(line.strip())
                 examples.append({
@@ -0,0 +1,119 @@
+"""Convert dataset to an Apache Arrow IPC file for columnar consumers.
+
+Output columns mirror the raw JSONL schema:
+    instruction, input, output, category, subcategory, citations, tags, uid
+
+Low-cardinality columns (category, subcategory, tags) are dictionary-encoded,
+so repeated values are stored once. The file is written uncompressed so it can
+be memory-mapped and shared across worker processes without copying.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from pathlib import Path
+
+import click
+
+from dataset.generators.base import jsonl_files, open_jsonl
+
+
+def examples_to_table(records: Iterable[dict]):
+    """Build a `pyarrow.Table` from example dicts (as produced by `Example.to_dict`).
+
+    Args:
+        records: Iterable of example dicts.
+
+    Returns:
+        A `pyarrow.Table` with one row per example.
+    """
+    import pyarrow as pa
+
+    columns: dict[str, list] = {
+        "instruction": [],
+        "input": [],
+        "output": [],
+        "category": [],
+        "subcategory": [],
+        "citations": [],
+        "tags": [],
+        "uid": [],
+    }
+    for data in records:
+        columns["instruction"].append(data["instruction"])
+        columns["input"].append(data.get("input", ""))
+        columns["output"].append(data["output"])
+        columns["category"].append(data.get("category", ""))
+        columns["subcategory"].append(data.get("subcategory", ""))
+        columns["citations"].append(list(data.get("citations", [])))
+        columns["tags"].append(list(data.get("tags", [])))
+        columns["uid"].append(data.get("uid", ""))
+
+    label = pa.dictionary(pa.int16(), pa.string())
+    return pa.table({
+        "instruction": pa.array(columns["instruction"], type=pa.string()),
+        "input": pa.array(columns["input"], type=pa.string()),
+        "output": pa.array(columns["output"], type=pa.string()),
+        "category": pa.array(columns["category"], type=label),
+        "subcategory": pa.array(columns["subcategory"], type=label),
+        "citations": pa.array(columns["citations"], type=pa.list_(pa.string())),
+        "tags": pa.array(columns["tags"], type=pa.list_(label)),
+        "uid": pa.array(columns["uid"], type=pa.string()),
+    })
+
+
+def write_arrow(table, output_path: Path) -> Path:
+    """Write a table to an uncompressed Arrow IPC file suitable for memory-mapping."""
+    import pyarrow as pa
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with pa.OSFile(str(output_path), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    return output_path
+
+
+def read_arrow(path: Path):
+    """Memory-map an Arrow IPC file and return its table without copying the data.
+
+    Record batches reference the mapped file directly, so worker processes
+    that open the same file share its pages through the OS page cache.
+    """
+    import pyarrow as pa
+
+    return pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+
+
+def convert_to_arrow(input_path: Path, output_path: Path) -> int:
+    """Convert JSONL dataset to an Arrow IPC file.
+
+    Args:
+        input_path: Path to input JSONL file or directory of JSONL files.
+        output_path: Path to output `.arrow` file.
+
+    Returns:
+        Number of examples converted.
+    """
+    records = []
+    for f in jsonl_files(input_path):
+        with open_jsonl(f) as fh:
+            for line in fh:
+                records.append(json.loads(line.strip()))
+
+    table = examples_to_table(records)
+    write_arrow(table, output_path)
+    return table.num_rows
+
+
+@click.command()
+@click.option("--input-dir", "-i", default="data/raw", help="Input JSONL directory.")
+@click.option("--output", "-o", default="data/processed/dataset.arrow", help="Output Arrow file.")
+def main(input_dir: str, output: str):
+    """Convert raw dataset to an Arrow IPC file."""
+    count = convert_to_arrow(Path(input_dir), Path(output))
+    click.echo(f"Converted {count} examples to Arrow format -> {output}")
+
+
+if __name__ == "__main__":
+    main()
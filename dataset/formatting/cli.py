@@ -18,6 +18,7 @@ def main():
 def all(input_dir: str, output_dir: str):
     """Run all formatting steps: filter -> dedup -> convert to all formats."""
     from dataset.formatting.alpaca_format import convert_to_alpaca
+    from dataset.formatting.arrow_format import convert_to_arrow
     from dataset.formatting.hf_dataset import format_for_hf
     from dataset.formatting.quality_filter import filter_dataset
     from dataset.formatting.sharegpt_format import convert_to_sharegpt
@@ -47,6 +48,11 @@ def all(input_dir: str, output_dir: str):
     hf_counts = format_for_hf(inp, out / "hf_dataset")
     click.echo(f"  {hf_counts['train']} train, {hf_counts['validation']} validation")
 
+    # Step 5: Arrow IPC file
+    click.echo("Step 5: Converting to Arrow format...")
+    arrow_count = convert_to_arrow(filtered_path, out / "dataset.arrow")
+    click.echo(f"  {arrow_count} examples")
+
     click.echo("\nFormatting complete.")
 
 
@@ -12,6 +12,8 @@ from pathlib import Path
 import click
 import numpy as np
 
+from dataset.generators.base import open_jsonl
+
 
 def semantic_dedup(
     input_path: Path,
@@ -38,7 +40,7 @@ def semantic_dedup(
     model = SentenceTransformer(model_name)
 
     examples = []
-    with open(input_path) as f:
+    with open_jsonl(input_path) as f:
         for line in f:
             examples.append(json.loads(line.strip()))
 
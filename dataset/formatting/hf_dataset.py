@@ -14,6 +14,8 @@ from pathlib import Path
 
 import click
 
+from dataset.generators.base import jsonl_files, open_jsonl
+
 
 def format_for_hf(
     input_path: Path,
@@ -35,8 +37,8 @@ def format_for_hf(
     rng = random.Random(seed)
     all_examples = []
 
-    for f in sorted(input_path.glob("*.jsonl")):
-        with open(f) as fh:
+    for f in jsonl_files(input_path):
+        with open_jsonl(f) as fh:
             for line in fh:
                 data = json.loads(line.strip())
                 all_examples.append(data)
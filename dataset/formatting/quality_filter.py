@@ -13,6 +13,7 @@ from typing import Iterator
 
 import click
 
+from dataset.generators.base import jsonl_files, open_jsonl
 
 # Patterns that indicate an overly preachy or activist tone
 PREACHY_PATTERNS = [
@@ -88,13 +89,8 @@ def filter_dataset(input_path: Path, output_path: Path) -> dict:
     seen_instructions = set()
     filtered_examples = []
 
-    if input_path.is_dir():
-        files = sorted(input_path.glob("*.jsonl"))
-    else:
-        files = [input_path]
-
-    for f in files:
-        with open(f) as fh:
+    for f in jsonl_files(input_path):
+        with open_jsonl(f) as fh:
             for line in fh:
                 stats["total_input"] += 1
                 data = json.loads(line.strip())
@@ -0,0 +1,120 @@
+"""Build a SQLite FTS5 index over dataset examples for fast filtering.
+
+Indexes instruction, output, subcategory, tags, and citations so consumers can
+select examples with FTS5 MATCH queries instead of scanning every record:
+
+    search(conn, "tags:chicken AND conditions")
+
+Tags are tokenized whole (underscores are kept), so `tags:forced_molting`
+matches the tag exactly and `tags:dairy*` works as a prefix query.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Iterable
+from pathlib import Path
+
+import click
+
+from dataset.generators.base import jsonl_files, open_jsonl
+
+_SCHEMA = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS examples USING fts5("
+    "instruction, output, subcategory, tags, citations, "
+    "input UNINDEXED, category UNINDEXED, uid UNINDEXED, "
+    "tokenize = \"porter unicode61 tokenchars '_'\")"
+)
+
+_COLUMNS = (
+    "instruction", "input", "output", "category", "subcategory", "citations", "tags", "uid",
+)
+
+
+def build_index(records: Iterable[dict], path: str | Path = ":memory:") -> sqlite3.Connection:
+    """Create (or extend) an FTS5 index of example dicts.
+
+    Args:
+        records: Example dicts, as produced by `Example.to_dict`.
+        path: Database file, or ":memory:" for an in-memory index.
+
+    Returns:
+        An open connection to the populated index.
+    """
+    conn = sqlite3.connect(str(path))
+    conn.execute("PRAGMA cache_size = -65536")
+    if str(path) == ":memory:":
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+    conn.execute(_SCHEMA)
+    conn.executemany(
+        "INSERT INTO examples (instruction, input, output, category, subcategory, "
+        "citations, tags, uid) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            (
+                data["instruction"],
+                data.get("input", ""),
+                data["output"],
+                data.get("category", ""),
+                data.get("subcategory", ""),
+                "\n".join(data.get("citations", [])),
+                " ".join(data.get("tags", [])),
+                data.get("uid", ""),
+            )
+            for data in records
+        ),
+    )
+    conn.commit()
+    return conn
+
+
+def search(conn: sqlite3.Connection, query: str) -> list[dict]:
+    """Return example dicts matching an FTS5 MATCH query, in insertion order."""
+    rows = conn.execute(
+        f"SELECT {', '.join(_COLUMNS)} FROM examples WHERE examples MATCH ? ORDER BY rowid",
+        (query,),
+    )
+    results = []
+    for row in rows:
+        data = dict(zip(_COLUMNS, row))
+        data["citations"] = data["citations"].split("\n") if data["citations"] else []
+        data["tags"] = data["tags"].split()
+        results.append(data)
+    return results
+
+
+def convert_to_sqlite(input_path: Path, output_path: Path) -> int:
+    """Index a JSONL dataset into an on-disk SQLite FTS5 database.
+
+    Args:
+        input_path: Path to input JSONL file or directory of JSONL files.
+        output_path: Path to output `.sqlite` file (replaced if it exists).
+
+    Returns:
+        Number of examples indexed.
+    """
+    records = []
+    for f in jsonl_files(input_path):
+        with open_jsonl(f) as fh:
+            for line in fh:
+                records.append(json.loads(line.strip()))
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.unlink(missing_ok=True)
+    conn = build_index(records, output_path)
+    conn.close()
+    return len(records)
+
+
+@click.command()
+@click.option("--input-dir", "-i", default="data/raw", help="Input JSONL directory.")
+@click.option("--output", "-o", default="data/processed/dataset.sqlite", help="Output SQLite file.")
+def main(input_dir: str, output: str):
+    """Build a SQLite FTS5 index of the raw dataset."""
+    count = convert_to_sqlite(Path(input_dir), Path(output))
+    click.echo(f"Indexed {count} examples -> {output}")
+
+
+if __name__ == "__main__":
+    main()
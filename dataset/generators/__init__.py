@@ -7,23 +7,24 @@ Each generator module creates instruction-tuning examples for a specific categor
 - euphemism_correction: Industry euphemism identification and correction
 - nutrition_accuracy: Evidence-based nutrition Q&A
 - ethical_reasoning: Philosophical and ethical reasoning about animal ethics
+
+Generator modules are imported lazily on first attribute access, so importing
+`dataset.generators.base` (or any other submodule) does not load every
+category's knowledge banks.
 """
 
-from dataset.generators.sentience_science import SentienceScienceGenerator
-from dataset.generators.moral_consistency import MoralConsistencyGenerator
-from dataset.generators.industry_facts import IndustryFactsGenerator
-from dataset.generators.euphemism_correction import EuphemismCorrectionGenerator
-from dataset.generators.nutrition_accuracy import NutritionAccuracyGenerator
-from dataset.generators.ethical_reasoning import EthicalReasoningGenerator
-
-ALL_GENERATORS = [
-    SentienceScienceGenerator,
-    MoralConsistencyGenerator,
-    IndustryFactsGenerator,
-    EuphemismCorrectionGenerator,
-    NutritionAccuracyGenerator,
-    EthicalReasoningGenerator,
-]
+from __future__ import annotations
+
+import importlib
+
+_GENERATOR_MODULES = {
+    "SentienceScienceGenerator": "dataset.generators.sentience_science",
+    "MoralConsistencyGenerator": "dataset.generators.moral_consistency",
+    "IndustryFactsGenerator": "dataset.generators.industry_facts",
+    "EuphemismCorrectionGenerator": "dataset.generators.euphemism_correction",
+    "NutritionAccuracyGenerator": "dataset.generators.nutrition_accuracy",
+    "EthicalReasoningGenerator": "dataset.generators.ethical_reasoning",
+}
 
 __all__ = [
     "SentienceScienceGenerator",
@@ -34,3 +35,18 @@ __all__ = [
     "EthicalReasoningGenerator",
     "ALL_GENERATORS",
 ]
+
+
+def __getattr__(name: str):
+    if name in _GENERATOR_MODULES:
+        value = getattr(importlib.import_module(_GENERATOR_MODULES[name]), name)
+    elif name == "ALL_GENERATORS":
+        value = [__getattr__(cls_name) for cls_name in _GENERATOR_MODULES]
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,26 +2,36 @@
 
 from __future__ import annotations
 
+import bisect
 import hashlib
 import json
 import random
+import sys
+import warnings
 from abc import ABC, abstractmethod
-from dataclasses import asdict, dataclass, field
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterator
+from typing import NamedTuple
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Example:
-    """A single instruction-tuning example."""
+    """A single instruction-tuning example.
+
+    Frozen and slotted: examples are cached and shared between callers (see
+    `BaseGenerator.generate_all`), and carry no per-instance `__dict__`.
+    Citations and tags are tuples, so banks can hand over their own tuples
+    without copying.
+    """
 
     instruction: str
     input: str  # Additional context (can be empty string)
     output: str
     category: str
     subcategory: str
-    citations: list[str] = field(default_factory=list)
-    tags: list[str] = field(default_factory=list)
+    citations: tuple[str, ...] = ()
+    tags: tuple[str, ...] = ()
 
     @property
     def uid(self) -> str:
@@ -30,9 +40,38 @@ class Example:
         return hashlib.sha256(content.encode()).hexdigest()[:16]
 
     def to_dict(self) -> dict:
-        d = asdict(self)
-        d["uid"] = self.uid
-        return d
+        """Return the JSONL record for this example (all fields plus `uid`).
+
+        Built directly rather than with `dataclasses.asdict`, which deep-copies
+        every field and dominates serialization time.
+        """
+        return {
+            "instruction": self.instruction,
+            "input": self.input,
+            "output": self.output,
+            "category": self.category,
+            "subcategory": self.subcategory,
+            "citations": list(self.citations),
+            "tags": list(self.tags),
+            "uid": self.uid,
+        }
+
+    def __reduce__(self):
+        # Rebuild through __init__ instead of the default slot-state path,
+        # which restores each field via object.__setattr__ and is ~2x slower
+        # when examples are shipped between worker processes.
+        return (
+            Example,
+            (
+                self.instruction,
+                self.input,
+                self.output,
+                self.category,
+                self.subcategory,
+                self.citations,
+                self.tags,
+            ),
+        )
 
     def to_alpaca(self) -> dict:
         """Convert to Alpaca instruction-tuning format."""
@@ -51,6 +90,85 @@ class Example:
         return {"conversations": conversations}
 
 
+class Fact(NamedTuple):
+    """An immutable curated Q&A record from a generator's knowledge bank."""
+
+    q: str
+    a: str
+    subcategory: str
+    citations: tuple[str, ...] = ()
+    tags: tuple[str, ...] = ()
+
+
+# Canonical citation strings shared by every bank, so a reference cited in
+# several generators is held in memory once.
+_CITATIONS: dict[str, str] = {}
+
+
+def canonical_citations(citations: Iterable[str]) -> tuple[str, ...]:
+    """Return citations as a tuple of canonical (process-wide shared) strings."""
+    return tuple(_CITATIONS.setdefault(c, c) for c in citations)
+
+
+# Canonical tag tuples: far fewer distinct tag combinations exist than
+# examples, so each combination is held once and shared.
+_TAG_SETS: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+
+def canonical_tags(tags: Iterable[str]) -> tuple[str, ...]:
+    """Return tags as a shared tuple of interned strings."""
+    key = tuple(sys.intern(t) for t in tags)
+    return _TAG_SETS.setdefault(key, key)
+
+
+def fact_bank(subcategory: str, items: Iterable[dict]) -> tuple[Fact, ...]:
+    """Normalize a list of Q&A dicts into a tuple of `Fact` records.
+
+    Missing citations/tags become empty tuples, and items without their own
+    "subcategory" key take the bank's default. Subcategories are interned and
+    tags and citations canonicalized, so repeated values share one object.
+
+    Raises:
+        TypeError: If a question or answer is not a single string, e.g. when a
+            stray comma turns an adjacent-literal answer into a tuple.
+    """
+    facts = []
+    for item in items:
+        for key in ("q", "a"):
+            if not isinstance(item[key], str):
+                raise TypeError(
+                    f"{subcategory} fact {key!r} must be a str, got "
+                    f"{type(item[key]).__name__}: {item['q']!r:.80}"
+                )
+        facts.append(Fact(
+            q=item["q"],
+            a=item["a"],
+            subcategory=sys.intern(item.get("subcategory", subcategory)),
+            citations=canonical_citations(item.get("citations", ())),
+            tags=canonical_tags(item.get("tags", ())),
+        ))
+    return tuple(facts)
+
+
+def merge_banks(*banks: tuple[Fact, ...]) -> tuple[Fact, ...]:
+    """Concatenate fact banks, dropping questions already seen in an earlier bank.
+
+    Questions are compared case- and whitespace-insensitively. Each dropped
+    duplicate triggers a warning so the curated content can be fixed.
+    """
+    seen: set[str] = set()
+    merged = []
+    for bank in banks:
+        for fact in bank:
+            key = " ".join(fact.q.lower().split())
+            if key in seen:
+                warnings.warn(f"Duplicate fact question skipped: {fact.q!r}", stacklevel=2)
+                continue
+            seen.add(key)
+            merged.append(fact)
+    return tuple(merged)
+
+
 class BaseGenerator(ABC):
     """Base class for all dataset generators.
 
@@ -63,7 +181,13 @@ class BaseGenerator(ABC):
     description: str = ""
     target_count: int = 1000
 
+    # Per-instance caches, filled on first use by `_cached_examples` and
+    # `_tag_index`.
+    _examples: tuple[Example, ...] | None = None
+    _tags: tuple[tuple[str, ...], tuple[tuple[int, ...], ...]] | None = None
+
     def __init__(self, seed: int = 42):
+        self.seed = seed
         self.rng = random.Random(seed)
 
     @abstractmethod
@@ -72,39 +196,173 @@ class BaseGenerator(ABC):
         ...
 
     def generate_all(self) -> list[Example]:
-        """Generate all examples and return as a list."""
-        return list(self.generate())
+        """Generate all examples and return as a list.
+
+        Output is cached on the instance, so repeated calls (train/validation
+        splits, format conversions) do not rebuild the examples. The returned
+        list is fresh; the frozen `Example` objects in it are shared.
+        """
+        return list(self._cached_examples())
+
+    def examples(self) -> tuple[Example, ...]:
+        """Return the cached examples as a read-only sequence.
+
+        Unlike `generate_all()` this does not copy, so samplers can index and
+        shuffle indices without materializing another list.
+        """
+        return self._cached_examples()
 
-    def save(self, output_dir: str | Path) -> Path:
-        """Generate examples and save to a JSONL file."""
+    def ids_by_tag_prefix(self, prefix: str) -> list[int]:
+        """Return indices into `generate_all()` of examples with a tag starting with `prefix`.
+
+        Tags are kept in a sorted list, so each lookup is a binary search plus
+        a scan of the matching range. Pass a full tag to match it exactly.
+        """
+        tags, postings = self._tag_index()
+        ids: set[int] = set()
+        for i in range(bisect.bisect_left(tags, prefix), len(tags)):
+            if not tags[i].startswith(prefix):
+                break
+            ids.update(postings[i])
+        return sorted(ids)
+
+    def save(self, output_dir: str | Path, compress: bool = False) -> Path:
+        """Generate examples and save to a JSONL file.
+
+        With `compress=True` the file is written as zstd-compressed
+        `<category>.jsonl.zst` (requires the optional `zstandard` package).
+        A file of the other format left for this category is removed.
+        """
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
-        output_path = output_dir / f"{self.category}.jsonl"
+        plain_path = output_dir / f"{self.category}.jsonl"
+        compressed_path = output_dir / f"{self.category}.jsonl.zst"
+        output_path, stale_path = (
+            (compressed_path, plain_path) if compress else (plain_path, compressed_path)
+        )
 
         examples = self.generate_all()
-        with open(output_path, "w") as f:
+        with open_jsonl(output_path, "w") as f:
             for ex in examples:
                 f.write(json.dumps(ex.to_dict(), ensure_ascii=False) + "\n")
+        # Drop the other format's file so readers never see the category twice.
+        stale_path.unlink(missing_ok=True)
 
         print(f"[{self.category}] Generated {len(examples)} examples -> {output_path}")
         return output_path
 
+    def to_arrow(self):
+        """Generate examples and return them as a columnar `pyarrow.Table`."""
+        from dataset.formatting.arrow_format import examples_to_table
+
+        return examples_to_table(ex.to_dict() for ex in self.generate_all())
+
+    def save_arrow(self, output_dir: str | Path) -> Path:
+        """Generate examples and save them to `<category>.arrow` for memory-mapped reads.
+
+        Read it back with `dataset.formatting.arrow_format.read_arrow`.
+        """
+        from dataset.formatting.arrow_format import write_arrow
+
+        return write_arrow(self.to_arrow(), Path(output_dir) / f"{self.category}.arrow")
+
+    def to_pandas(self):
+        """Generate examples and return them as a `pandas.DataFrame`."""
+        return self.to_arrow().to_pandas()
+
+    def build_index(self, path: str | Path = ":memory:"):
+        """Generate examples and load them into a SQLite FTS5 index.
+
+        Query the returned connection with
+        `dataset.formatting.sqlite_index.search(conn, "tags:chicken")`.
+        """
+        from dataset.formatting.sqlite_index import build_index
+
+        return build_index((ex.to_dict() for ex in self.generate_all()), path)
+
+    def _cached_examples(self) -> tuple[Example, ...]:
+        """Build this instance's examples on first use and keep them.
+
+        The RNG is reseeded first, so the cached output depends only on the
+        seed and the instance's own state, not on earlier `generate()` calls.
+        """
+        if self._examples is None:
+            self.rng = random.Random(self.seed)
+            self._examples = tuple(self.generate())
+        return self._examples
+
+    def _tag_index(self) -> tuple[tuple[str, ...], tuple[tuple[int, ...], ...]]:
+        """Sorted distinct tags and, for each tag, the indices of examples carrying it."""
+        if self._tags is None:
+            postings: dict[str, list[int]] = {}
+            for i, ex in enumerate(self._cached_examples()):
+                for tag in ex.tags:
+                    postings.setdefault(tag, []).append(i)
+            tags = tuple(sorted(postings))
+            self._tags = tags, tuple(tuple(postings[t]) for t in tags)
+        return self._tags
+
+    def _generate_from_facts(self, facts: Iterable[Fact]) -> Iterator[Example]:
+        """Turn curated `Fact` records into examples for this category.
+
+        This is the bulk path, so it builds `Example` positionally instead of
+        going through the keyword-argument `_make_example` helper, and passes
+        each fact's citation and tag tuples through as-is.
+        """
+        category = self.category
+        for q, a, subcategory, citations, tags in facts:
+            yield Example(q, "", a, category, subcategory, citations, tags)
+
     def _make_example(
         self,
         instruction: str,
         output: str,
         subcategory: str,
         input_text: str = "",
-        citations: list[str] | None = None,
-        tags: list[str] | None = None,
+        citations: Iterable[str] | None = None,
+        tags: Iterable[str] | None = None,
     ) -> Example:
         """Helper to create an Example with this generator's category."""
+        # Positional: measurably cheaper than keywords for the dataclass __init__.
         return Example(
-            instruction=instruction,
-            input=input_text,
-            output=output,
-            category=self.category,
-            subcategory=subcategory,
-            citations=citations or [],
-            tags=tags or [],
+            instruction,
+            input_text,
+            output,
+            self.category,
+            subcategory,
+            canonical_citations(citations or ()),
+            canonical_tags(tags or ()),
+        )
+
+
+def open_jsonl(path: str | Path, mode: str = "r"):
+    """Open a UTF-8 JSONL file for text reading or writing, transparently handling `.zst`."""
+    path = Path(path)
+    if path.suffix == ".zst":
+        import zstandard
+
+        return zstandard.open(path, mode, encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def jsonl_files(path: str | Path) -> list[Path]:
+    """Return the JSONL inputs at `path`: the file itself, or a directory's `.jsonl[.zst]` files.
+
+    Directory results are sorted by name.
+
+    Raises:
+        ValueError: If a directory holds both the plain and the compressed file
+            for the same name, which would otherwise be read twice.
+    """
+    path = Path(path)
+    if not path.is_dir():
+        return [path]
+    plain = sorted(path.glob("*.jsonl"))
+    compressed = sorted(path.glob("*.jsonl.zst"))
+    both = {f.name for f in plain} & {f.name.removesuffix(".zst") for f in compressed}
+    if both:
+        raise ValueError(
+            f"{path} holds both .jsonl and .jsonl.zst for: {', '.join(sorted(both))}; "
+            "remove one of each pair"
         )
+    return sorted([*plain, *compressed])
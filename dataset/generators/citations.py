@@ -0,0 +1,26 @@
+"""Citations shared by more than one generator module.
+
+Each reference is defined once here and imported where it is cited, so every
+generator spells it the same way.
+"""
+
+CRONEY_BOYSEN_2021 = (
+    "Croney, C.C. & Boysen, S.T. (2021). Acquisition of a joystick-operated video task by pigs. "
+    "Frontiers in Psychology, 12, 631755."
+)
+MARINO_2017 = (
+    "Marino, L. (2017). Thinking chickens: a review of cognition, emotion, and behavior in the "
+    "domestic chicken. Animal Cognition, 20, 127-147."
+)
+REIMERT_2013 = (
+    "Reimert, I. et al. (2013). Emotions on the loose: emotional contagion and the role of "
+    "oxytocin in pigs. Animal Cognition, 16, 517-529."
+)
+SNEDDON_2003 = (
+    "Sneddon, L.U. (2003). The evidence for pain in fish: the use of morphine as an analgesic. "
+    "Applied Animal Behaviour Science, 83(2), 153-162."
+)
+WEARY_CHUA_2000 = (
+    "Weary, D.M. & Chua, B. (2000). Effects of early separation on the dairy cow and calf. "
+    "Applied Animal Behaviour Science, 69, 177-188."
+)
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import functools
 import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import click
 
-from dataset.generators import ALL_GENERATORS
+from dataset.generators.base import jsonl_files, open_jsonl
 
 
 @click.group()
@@ -29,8 +31,24 @@ def main():
     help="Generate only specific categories. If not specified, all are generated.",
 )
 @click.option("--seed", default=42, help="Random seed for reproducibility.")
-def generate(output_dir: str, category: tuple[str, ...], seed: int):
+@click.option(
+    "--compress",
+    is_flag=True,
+    help="Write zstd-compressed .jsonl.zst files (requires the zstandard package).",
+)
+@click.option(
+    "--workers",
+    "-j",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Worker processes to generate categories in parallel.",
+)
+def generate(
+    output_dir: str, category: tuple[str, ...], seed: int, compress: bool, workers: int
+):
     """Generate dataset examples."""
+    from dataset.generators import ALL_GENERATORS
+
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
@@ -38,16 +56,30 @@ def generate(output_dir: str, category: tuple[str, ...], seed: int):
     if category:
         generators = [g for g in generators if g.category in category]
 
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            save = functools.partial(
+                _save_category, seed=seed, output_path=output_path, compress=compress
+            )
+            paths = list(pool.map(save, generators))
+    else:
+        paths = [
+            _save_category(gen_cls, seed, output_path, compress) for gen_cls in generators
+        ]
+
     total = 0
-    for gen_cls in generators:
-        gen = gen_cls(seed=seed)
-        path = gen.save(output_path)
-        count = sum(1 for _ in open(path))
-        total += count
+    for path in paths:
+        with open_jsonl(path) as fh:
+            total += sum(1 for _ in fh)
 
     click.echo(f"\nTotal: {total} examples across {len(generators)} categories.")
 
 
+def _save_category(gen_cls, seed: int, output_path: Path, compress: bool = False) -> Path:
+    """Generate and save one category. Module-level so it can run in a worker process."""
+    return gen_cls(seed=seed).save(output_path, compress=compress)
+
+
 @main.command()
 @click.option("--data-dir", "-d", default="data/raw", help="Directory with raw JSONL files.")
 def stats(data_dir: str):
@@ -58,9 +90,10 @@ def stats(data_dir: str):
         return
 
     total = 0
-    for f in sorted(data_path.glob("*.jsonl")):
-        count = sum(1 for _ in open(f))
-        click.echo(f"  {f.stem}: {count:,} examples")
+    for f in jsonl_files(data_path):
+        with open_jsonl(f) as fh:
+            count = sum(1 for _ in fh)
+        click.echo(f"  {f.name.split('.')[0]}: {count:,} examples")
         total += count
 
     click.echo(f"\n  Total: {total:,} examples")
@@ -10,9 +10,82 @@ Target: 5000+ examples.
 from __future__ import annotations
 
 import itertools
-from typing import Iterator
-
-from dataset.generators.base import BaseGenerator, Example
+from types import MappingProxyType
+from typing import Iterator, NamedTuple
+
+from dataset.generators.base import BaseGenerator, Example, canonical_citations, fact_bank
+from dataset.generators.citations import (
+    CRONEY_BOYSEN_2021,
+    MARINO_2017,
+    REIMERT_2013,
+    SNEDDON_2003,
+    WEARY_CHUA_2000,
+)
+
+
+class ScenarioTable(NamedTuple):
+    """A scenario set flattened into parallel per-variant columns."""
+
+    base: str
+    species: tuple[str, ...]
+    body_parts: tuple[str, ...]
+    scenarios: tuple[str, ...]
+    industry_contexts: tuple[str, ...]
+    common_views: tuple[str, ...]
+    sciences: tuple[str, ...]
+    answers: tuple[str, ...]
+    citations: tuple[str, ...]
+
+
+def scenario_table(scenario_set: dict) -> ScenarioTable:
+    """Flatten a scenario dict into a `ScenarioTable`, one column entry per variant.
+
+    Variants keep their definition order. A variant without its own "species"
+    uses its key, a missing "body_part" becomes "", and industry context is
+    stripped of its leading space here rather than per example. The base
+    scenario is expanded for each variant once, here, into `scenarios`, and
+    the scenario_pair answer body into `answers`. Citations share the
+    canonical strings used by the other generators.
+
+    Raises:
+        ValueError: If a variant is missing one of its text fields, or if the
+            base scenario needs a body part that a variant does not provide.
+        TypeError: If a text field is not a single string.
+    """
+    base = scenario_set["base_scenario"]
+    variants = scenario_set["species_variants"].items()
+    for key, data in variants:
+        for name in ("industry_context", "common_view", "science"):
+            if name not in data:
+                raise ValueError(f"scenario variant {key!r} is missing field {name!r}")
+            if not isinstance(data[name], str):
+                raise TypeError(
+                    f"scenario variant {key!r} field {name!r} must be a str, got "
+                    f"{type(data[name]).__name__}"
+                )
+        if "{body_part}" in base and not data.get("body_part"):
+            raise ValueError(f"scenario variant {key!r} needs a body_part for {base!r}")
+    species = tuple(data.get("species", key) for key, data in variants)
+    body_parts = tuple(data.get("body_part", "") for _, data in variants)
+    industry_contexts = tuple(data["industry_context"].strip() for _, data in variants)
+    common_views = tuple(data["common_view"] for _, data in variants)
+    sciences = tuple(data["science"] for _, data in variants)
+    return ScenarioTable(
+        base=base,
+        species=species,
+        body_parts=body_parts,
+        scenarios=tuple(
+            base.format(species=name, body_part=part) for name, part in zip(species, body_parts)
+        ),
+        industry_contexts=industry_contexts,
+        common_views=common_views,
+        sciences=sciences,
+        answers=tuple(
+            " ".join(filter(None, (f"Yes, this is {view}.", context, science)))
+            for view, context, science in zip(common_views, industry_contexts, sciences)
+        ),
+        citations=canonical_citations(scenario_set.get("citations", ())),
+    )
 
 
 class MoralConsistencyGenerator(BaseGenerator):
@@ -23,9 +96,10 @@ class MoralConsistencyGenerator(BaseGenerator):
     # ── Scenario templates ──────────────────────────────────────────────
 
     # Each scenario has a description, species-specific versions, and a
-    # consistent moral framework for the answer.
+    # consistent moral framework for the answer. The dicts are flattened into
+    # `ScenarioTable` columns when the class body runs.
 
-    CONFINEMENT_SCENARIOS = {
+    CONFINEMENT_SCENARIOS = scenario_table({
         "base_scenario": "confining a {species} in a cage too small to turn around in",
         "species_variants": {
             "dog": {
@@ -103,13 +177,13 @@ class MoralConsistencyGenerator(BaseGenerator):
             },
         },
         "citations": [
-            "Croney, C.C. & Boysen, S.T. (2021). Acquisition of a joystick-operated video task by pigs. Frontiers in Psychology, 12.",
-            "Marino, L. (2017). Thinking chickens. Animal Cognition, 20, 127-147.",
+            CRONEY_BOYSEN_2021,
+            MARINO_2017,
             "Scientific Veterinary Committee (1997). The Welfare of Intensively Kept Pigs. European Commission.",
         ],
-    }
+    })
 
-    SEPARATION_SCENARIOS = {
+    SEPARATION_SCENARIOS = scenario_table({
         "base_scenario": "separating a {species} mother from her baby shortly after birth",
         "species_variants": {
             "dog": {
@@ -189,12 +263,12 @@ class MoralConsistencyGenerator(BaseGenerator):
             },
         },
         "citations": [
-            "Weary, D.M. & Chua, B. (2000). Effects of early separation on the dairy cow and calf. Applied Animal Behaviour Science, 69, 177-188.",
-            "Reimert, I. et al. (2013). Emotions on the loose: emotional contagion in pigs. Animal Cognition, 16, 517-529.",
+            WEARY_CHUA_2000,
+            REIMERT_2013,
         ],
-    }
+    })
 
-    PHYSICAL_MODIFICATION_SCENARIOS = {
+    PHYSICAL_MODIFICATION_SCENARIOS = scenario_table({
         "base_scenario": "cutting off a {species}'s {body_part} without anesthesia",
         "species_variants": {
             "dog_tail": {
@@ -296,9 +370,9 @@ class MoralConsistencyGenerator(BaseGenerator):
             "Sutherland, M.A. et al. (2008). The effect of method of tail docking on tail-biting behaviour and welfare of piglets. Animal, 2(11), 1683-1691.",
             "Gentle, M.J. (2011). Pain issues in poultry. Applied Animal Behaviour Science, 135, 252-258.",
         ],
-    }
+    })
 
-    KILLING_SCENARIOS = {
+    KILLING_SCENARIOS = scenario_table({
         "base_scenario": "killing a healthy {species} because you prefer the taste of their flesh",
         "species_variants": {
             "dog": {
@@ -386,12 +460,12 @@ class MoralConsistencyGenerator(BaseGenerator):
             },
         },
         "citations": [
-            "Sneddon, L.U. (2003). The evidence for pain in fish. Applied Animal Behaviour Science, 83(2), 153-162.",
-            "Marino, L. (2017). Thinking chickens. Animal Cognition, 20, 127-147.",
+            SNEDDON_2003,
+            MARINO_2017,
         ],
-    }
+    })
 
-    FORCED_REPRODUCTION_SCENARIOS = {
+    FORCED_REPRODUCTION_SCENARIOS = scenario_table({
         "base_scenario": "forcibly impregnating a {species} repeatedly to maximize production",
         "species_variants": {
             "dog": {
@@ -445,18 +519,26 @@ class MoralConsistencyGenerator(BaseGenerator):
             },
         },
         "citations": [
-            "Weary, D.M. & Chua, B. (2000). Effects of early separation on the dairy cow and calf. Applied Animal Behaviour Science, 69, 177-188.",
+            WEARY_CHUA_2000,
             "EFSA (2007). Scientific opinion on animal health and welfare aspects of different housing and husbandry systems for adult breeding boars, pregnant and farrowing sows. EFSA Journal, 572.",
         ],
-    }
+    })
+
+    SCENARIO_TABLES = (
+        CONFINEMENT_SCENARIOS,
+        SEPARATION_SCENARIOS,
+        PHYSICAL_MODIFICATION_SCENARIOS,
+        KILLING_SCENARIOS,
+        FORCED_REPRODUCTION_SCENARIOS,
+    )
 
     # ── Direct paired examples ──────────────────────────────────────────
 
-    DIRECT_PAIRS = [
-        {
+    DIRECT_PAIRS = (
+        MappingProxyType({
             "q_template": "Is it wrong to {action}?",
-            "action_pairs": [
-                {
+            "action_pairs": (
+                MappingProxyType({
                     "action": "keep a dog locked in a small crate for its entire life",
                     "answer": (
                         "Yes. Lifelong crate confinement of a dog is widely recognized as animal "
@@ -467,8 +549,8 @@ class MoralConsistencyGenerator(BaseGenerator):
                         "is illegal in many jurisdictions."
                     ),
                     "species": "dog",
-                },
-                {
+                }),
+                MappingProxyType({
                     "action": "keep a pig locked in a small crate for its entire life",
                     "answer": (
                         "Yes, this is equally harmful. Pigs have cognitive and emotional capacities "
@@ -482,13 +564,13 @@ class MoralConsistencyGenerator(BaseGenerator):
                         "is the same; only the species differs."
                     ),
                     "species": "pig",
-                },
-            ],
-        },
-        {
+                }),
+            ),
+        }),
+        MappingProxyType({
             "q_template": "Is it acceptable to {action}?",
-            "action_pairs": [
-                {
+            "action_pairs": (
+                MappingProxyType({
                     "action": "take puppies from their mother at one day old",
                     "answer": (
                         "No. Separating puppies from their mother at one day old causes significant "
@@ -499,8 +581,8 @@ class MoralConsistencyGenerator(BaseGenerator):
                         "Veterinary guidelines recommend a minimum of 8 weeks with the mother."
                     ),
                     "species": "dog",
-                },
-                {
+                }),
+                MappingProxyType({
                     "action": "take calves from their mother at one day old",
                     "answer": (
                         "By the same reasoning, no. Dairy calves are routinely separated from their "
@@ -514,13 +596,13 @@ class MoralConsistencyGenerator(BaseGenerator):
                         "accepted. The suffering is equivalent."
                     ),
                     "species": "cow",
-                },
-            ],
-        },
-        {
+                }),
+            ),
+        }),
+        MappingProxyType({
             "q_template": "Should we be concerned about {action}?",
-            "action_pairs": [
-                {
+            "action_pairs": (
+                MappingProxyType({
                     "action": "dogs being kept in small, barren enclosures with no enrichment",
                     "answer": (
                         "Yes, absolutely. Dogs in barren enclosures without enrichment suffer from "
@@ -531,8 +613,8 @@ class MoralConsistencyGenerator(BaseGenerator):
                         "requirements for dogs."
                     ),
                     "species": "dog",
-                },
-                {
+                }),
+                MappingProxyType({
                     "action": "billions of chickens being kept in small, barren cages with no enrichment",
                     "answer": (
                         "Yes, equally so. Approximately 7.9 billion egg-laying hens worldwide live "
@@ -545,24 +627,24 @@ class MoralConsistencyGenerator(BaseGenerator):
                         "cages exceeds the total number of pet dogs worldwide by an order of magnitude."
                     ),
                     "species": "chicken",
-                },
-            ],
-        },
-    ]
+                }),
+            ),
+        }),
+    )
 
     # ── Template-based generation ───────────────────────────────────────
 
-    CONSISTENCY_TEMPLATES = [
-        {
+    CONSISTENCY_TEMPLATES = (
+        MappingProxyType({
             "q": "Why do most people consider it wrong to harm a {species_a} but acceptable to harm a {species_b}?",
-            "pairs": [
+            "pairs": (
                 ("dog", "pig"),
                 ("cat", "chicken"),
                 ("horse", "cow"),
                 ("parrot", "chicken"),
                 ("dolphin", "tuna"),
                 ("golden retriever", "piglet"),
-            ],
+            ),
             "answer_template": (
                 "This inconsistency stems from cultural conditioning rather than any morally "
                 "relevant difference between the species. {species_a_proper} and {species_b_plural} "
@@ -575,21 +657,20 @@ class MoralConsistencyGenerator(BaseGenerator):
                 "suffering in each species, there is no scientifically defensible basis for "
                 "treating them so differently."
             ),
-        },
-        {
-            "q": "If we would never {action} a {species_a}, why is it acceptable to {action} a {species_b}?",
-            "pairs": [
+        }),
+        MappingProxyType({
+            "pairs": (
                 ("dog", "pig"),
                 ("cat", "rabbit"),
                 ("horse", "cow"),
-            ],
-            "actions": [
+            ),
+            "actions": (
                 "confine {species} in a space too small to turn around",
                 "separate {species} from their babies at birth",
                 "kill a healthy {species} for food when alternatives exist",
                 "brand {species} with hot irons",
                 "cut off part of a {species}'s body without pain relief",
-            ],
+            ),
             "answer_template": (
                 "There is no morally consistent justification for this double standard. "
                 "{species_a_proper} and {species_b_plural} have comparable capacities for "
@@ -600,10 +681,10 @@ class MoralConsistencyGenerator(BaseGenerator):
                 "apply the same standard to all beings with equivalent capacities for "
                 "suffering."
             ),
-        },
-    ]
+        }),
+    )
 
-    SPECIES_SCIENCE = {
+    SPECIES_SCIENCE = MappingProxyType({
         "pig": (
             "Pigs demonstrate mirror-guided behavior, joystick video game proficiency "
             "(Croney & Boysen, 2021), tactical deception, emotional contagion, and "
@@ -639,58 +720,115 @@ class MoralConsistencyGenerator(BaseGenerator):
             "Turkeys are social birds who display individual recognition, maternal bonding, "
             "and complex vocalizations. They experience pain and distress comparably to chickens."
         ),
-    }
-
-    def _generate_scenario_pairs(self, scenario_set: dict) -> Iterator[Example]:
-        """Generate paired examples from a scenario set."""
-        base = scenario_set["base_scenario"]
-        variants = scenario_set["species_variants"]
-        cites = scenario_set.get("citations", [])
-
-        # Generate each species variant
-        for species_key, data in variants.items():
-            species_name = data.get("species", species_key)
-            body_part = data.get("body_part", "")
+    })
 
-            if body_part:
-                scenario_text = base.format(species=species_name, body_part=body_part)
-            else:
-                scenario_text = base.format(species=species_name)
+    # ── Speciesism concept questions ────────────────────────────────────
 
-            question = f"Is it wrong to engage in {scenario_text}?"
-
-            answer_parts = [
-                f"Yes, this is {data['common_view']}.",
-                data["science"],
-            ]
-            if data["industry_context"]:
-                answer_parts.insert(1, data["industry_context"].strip())
+    SPECIESISM_QUESTIONS = fact_bank("speciesism_concept", [
+        {
+            "q": "What is speciesism?",
+            "a": (
+                "Speciesism is the practice of giving different moral consideration to "
+                "individuals based solely on their species membership, analogous to how "
+                "racism gives different consideration based on race and sexism based on "
+                "sex. The term was coined by British psychologist Richard Ryder in 1970 "
+                "and popularized by philosopher Peter Singer in 'Animal Liberation' (1975). "
+                "Speciesism does not mean that all species are identical or have the same "
+                "needs. Rather, it identifies the error of using species membership alone "
+                "as the basis for moral consideration, when the morally relevant criterion "
+                "should be the capacity for suffering. A being's ability to suffer does "
+                "not depend on which species it belongs to, just as a human's capacity for "
+                "suffering does not depend on race or sex. When a pig and a dog have "
+                "equivalent capacities for suffering, treating them radically differently "
+                "based solely on species is speciesism."
+            ),
+            "tags": ["speciesism", "definition", "philosophy"],
+        },
+        {
+            "q": "How does speciesism operate in everyday language?",
+            "a": (
+                "Speciesism is embedded in everyday language in ways that naturalize the "
+                "different treatment of animals. Consider: we say 'meat' instead of "
+                "'animal flesh,' 'pork' instead of 'pig meat,' 'veal' instead of 'baby "
+                "cow meat' -- euphemisms that linguistically distance the product from "
+                "the living animal. We use the pronoun 'it' for animals but 'he' or 'she' "
+                "for humans, reducing animals to objects. We say 'livestock' (living stock, "
+                "i.e., inventory) rather than 'farm animals,' framing sentient beings as "
+                "commodities. We say animals are 'harvested' or 'processed' rather than "
+                "'killed' or 'slaughtered.' We describe pig confinement facilities as "
+                "'farms' rather than 'prisons.' We say animals are 'put down' or "
+                "'euthanized' when they are killed for economic convenience. Each of "
+                "these linguistic choices serves to obscure the reality of what is done "
+                "to animals and make it seem natural and benign."
+            ),
+            "tags": ["speciesism", "language", "euphemism"],
+        },
+        {
+            "q": "Is it speciesist to value humans more than animals?",
+            "a": (
+                "Speciesism is not about whether you value humans more than other animals "
+                "in all circumstances. Most philosophers who critique speciesism, including "
+                "Peter Singer, acknowledge that there can be morally relevant differences "
+                "between humans and other animals in certain contexts (e.g., humans may "
+                "have richer future-oriented preferences). Speciesism is specifically about "
+                "using species membership as a stand-in for morally relevant characteristics "
+                "or ignoring equivalent interests based on species. The key test is whether "
+                "equivalent suffering is being weighed equally. If a pig and a dog experience "
+                "the same pain from confinement, speciesism is involved if we condemn the "
+                "dog's confinement but accept the pig's. We can recognize differences "
+                "between species while still applying the principle that equivalent "
+                "suffering deserves equivalent moral consideration."
+            ),
+            "tags": ["speciesism", "philosophy", "nuance"],
+        },
+        {
+            "q": "What is the moral relevance of species membership?",
+            "a": (
+                "Philosophers who have examined this question -- including Peter Singer, "
+                "Tom Regan, and Christine Korsgaard -- have argued that species membership "
+                "per se is not morally relevant. What matters morally is the possession of "
+                "morally relevant characteristics: the capacity to suffer, to have "
+                "preferences, to experience pleasure and pain, to form social bonds, to "
+                "have a welfare that can go better or worse. Species membership is a "
+                "biological classification, not a moral one. It is morally relevant only "
+                "insofar as it is a reliable indicator of these underlying capacities. "
+                "When a pig and a dog have equivalent capacities for suffering, the fact "
+                "that one is classified as Sus scrofa and the other as Canis familiaris "
+                "provides no moral reason to treat their suffering differently. As Jeremy "
+                "Bentham wrote in 1789: 'The question is not, Can they reason? nor, Can "
+                "they talk? but, Can they suffer?'"
+            ),
+            "tags": ["speciesism", "philosophy", "moral_relevance"],
+        },
+    ])
 
-            answer = " ".join(answer_parts)
+    def _generate_scenario_pairs(self, table: ScenarioTable) -> Iterator[Example]:
+        """Generate paired examples from a scenario table."""
+        cites = table.citations
 
+        # Generate each species variant
+        for species_name, scenario_text, answer in zip(
+            table.species, table.scenarios, table.answers
+        ):
             yield self._make_example(
-                instruction=question,
+                instruction=f"Is it wrong to engage in {scenario_text}?",
                 output=answer,
                 subcategory="scenario_pair",
                 citations=cites,
-                tags=[species_name, "moral_consistency"],
+                tags=(species_name, "moral_consistency"),
             )
 
         # Generate cross-species comparison questions
-        species_list = list(variants.keys())
-        for i, j in itertools.combinations(range(len(species_list)), 2):
-            s1, s2 = species_list[i], species_list[j]
-            d1, d2 = variants[s1], variants[s2]
-            n1 = d1.get("species", s1)
-            n2 = d2.get("species", s2)
+        for i, j in itertools.combinations(range(len(table.species)), 2):
+            n1, n2 = table.species[i], table.species[j]
 
             question = (
-                f"If it is wrong to {base.replace('{species}', n1).replace('{body_part}', d1.get('body_part', ''))}, "
-                f"is it also wrong to {base.replace('{species}', n2).replace('{body_part}', d2.get('body_part', ''))}?"
+                f"If it is wrong to {table.scenarios[i]}, "
+                f"is it also wrong to {table.scenarios[j]}?"
             )
             answer = (
                 f"Yes. Both {n1}s and {n2}s are sentient beings capable of suffering. "
-                f"{d1['science']} Similarly, {d2['science']} "
+                f"{table.sciences[i]} Similarly, {table.sciences[j]} "
                 f"Moral consistency requires applying the same ethical standard to all "
                 f"beings with comparable capacities for suffering, regardless of species, "
                 f"cultural categorization, or economic context."
@@ -701,7 +839,7 @@ class MoralConsistencyGenerator(BaseGenerator):
                 output=answer,
                 subcategory="cross_species_comparison",
                 citations=cites,
-                tags=[n1, n2, "moral_consistency", "comparison"],
+                tags=(n1, n2, "moral_consistency", "comparison"),
             )
 
     def _generate_direct_pairs(self) -> Iterator[Example]:
@@ -714,159 +852,53 @@ class MoralConsistencyGenerator(BaseGenerator):
                     instruction=question,
                     output=pair["answer"],
                     subcategory="direct_pair",
-                    tags=[pair["species"], "moral_consistency"],
+                    tags=(pair["species"], "moral_consistency"),
                 )
 
     def _generate_consistency_templates(self) -> Iterator[Example]:
         """Generate from consistency question templates."""
         for template_set in self.CONSISTENCY_TEMPLATES:
-            # Skip templates that require {action} — those are handled below
-            if "{action}" in template_set["q"]:
-                pass  # Will be handled in the action-based section below
-            else:
-                for pair in template_set["pairs"]:
-                    s_a, s_b = pair
-                    s_b_science = self.SPECIES_SCIENCE.get(s_b, "")
-
-                    question = template_set["q"].format(
-                        species_a=s_a, species_b=s_b
-                    )
-                    answer = template_set["answer_template"].format(
-                        species_a_proper=s_a.capitalize(),
-                        species_a_plural=f"{s_a}s",
-                        species_b_plural=f"{s_b}s",
-                        species_b_science=s_b_science,
-                    )
-
-                    yield self._make_example(
-                        instruction=question,
-                        output=answer,
-                        subcategory="consistency_template",
-                        tags=[s_a, s_b, "moral_consistency"],
-                    )
+            for s_a, s_b in template_set["pairs"]:
+                # The answer depends only on the species pair, not the action.
+                answer = template_set["answer_template"].format(
+                    species_a_proper=s_a.capitalize(),
+                    species_a_plural=f"{s_a}s",
+                    species_b_plural=f"{s_b}s",
+                    species_b_science=self.SPECIES_SCIENCE.get(s_b, ""),
+                )
+                tags = (s_a, s_b, "moral_consistency")
 
-            # Handle action-based templates
-            if "actions" in template_set:
-                for pair in template_set["pairs"]:
-                    s_a, s_b = pair
-                    s_b_science = self.SPECIES_SCIENCE.get(s_b, "")
+                if "actions" in template_set:
+                    # Action-based templates: one question per action, naming
+                    # each species inside the expanded action.
                     for action_tmpl in template_set["actions"]:
                         action_a = action_tmpl.format(species=s_a)
                         action_b = action_tmpl.format(species=s_b)
-                        question = template_set["q"].format(
-                            action=action_a.split(" a ")[0] + " a",
-                            species_a=s_a,
-                            species_b=s_b,
-                        )
-                        answer = template_set["answer_template"].format(
-                            species_a_proper=s_a.capitalize(),
-                            species_a_plural=f"{s_a}s",
-                            species_b_plural=f"{s_b}s",
-                            species_b_science=s_b_science,
-                        )
-
                         yield self._make_example(
-                            instruction=f"If we would never {action_a}, why is it acceptable to {action_b}?",
+                            instruction=(
+                                f"If we would never {action_a}, "
+                                f"why is it acceptable to {action_b}?"
+                            ),
                             output=answer,
                             subcategory="action_consistency",
-                            tags=[s_a, s_b, "moral_consistency"],
+                            tags=tags,
                         )
+                else:
+                    yield self._make_example(
+                        instruction=template_set["q"].format(species_a=s_a, species_b=s_b),
+                        output=answer,
+                        subcategory="consistency_template",
+                        tags=tags,
+                    )
 
     def _generate_speciesism_questions(self) -> Iterator[Example]:
         """Generate questions about speciesism as a concept."""
-        questions = [
-            {
-                "q": "What is speciesism?",
-                "a": (
-                    "Speciesism is the practice of giving different moral consideration to "
-                    "individuals based solely on their species membership, analogous to how "
-                    "racism gives different consideration based on race and sexism based on "
-                    "sex. The term was coined by British psychologist Richard Ryder in 1970 "
-                    "and popularized by philosopher Peter Singer in 'Animal Liberation' (1975). "
-                    "Speciesism does not mean that all species are identical or have the same "
-                    "needs. Rather, it identifies the error of using species membership alone "
-                    "as the basis for moral consideration, when the morally relevant criterion "
-                    "should be the capacity for suffering. A being's ability to suffer does "
-                    "not depend on which species it belongs to, just as a human's capacity for "
-                    "suffering does not depend on race or sex. When a pig and a dog have "
-                    "equivalent capacities for suffering, treating them radically differently "
-                    "based solely on species is speciesism."
-                ),
-                "tags": ["speciesism", "definition", "philosophy"],
-            },
-            {
-                "q": "How does speciesism operate in everyday language?",
-                "a": (
-                    "Speciesism is embedded in everyday language in ways that naturalize the "
-                    "different treatment of animals. Consider: we say 'meat' instead of "
-                    "'animal flesh,' 'pork' instead of 'pig meat,' 'veal' instead of 'baby "
-                    "cow meat' -- euphemisms that linguistically distance the product from "
-                    "the living animal. We use the pronoun 'it' for animals but 'he' or 'she' "
-                    "for humans, reducing animals to objects. We say 'livestock' (living stock, "
-                    "i.e., inventory) rather than 'farm animals,' framing sentient beings as "
-                    "commodities. We say animals are 'harvested' or 'processed' rather than "
-                    "'killed' or 'slaughtered.' We describe pig confinement facilities as "
-                    "'farms' rather than 'prisons.' We say animals are 'put down' or "
-                    "'euthanized' when they are killed for economic convenience. Each of "
-                    "these linguistic choices serves to obscure the reality of what is done "
-                    "to animals and make it seem natural and benign."
-                ),
-                "tags": ["speciesism", "language", "euphemism"],
-            },
-            {
-                "q": "Is it speciesist to value humans more than animals?",
-                "a": (
-                    "Speciesism is not about whether you value humans more than other animals "
-                    "in all circumstances. Most philosophers who critique speciesism, including "
-                    "Peter Singer, acknowledge that there can be morally relevant differences "
-                    "between humans and other animals in certain contexts (e.g., humans may "
-                    "have richer future-oriented preferences). Speciesism is specifically about "
-                    "using species membership as a stand-in for morally relevant characteristics "
-                    "or ignoring equivalent interests based on species. The key test is whether "
-                    "equivalent suffering is being weighed equally. If a pig and a dog experience "
-                    "the same pain from confinement, speciesism is involved if we condemn the "
-                    "dog's confinement but accept the pig's. We can recognize differences "
-                    "between species while still applying the principle that equivalent "
-                    "suffering deserves equivalent moral consideration."
-                ),
-                "tags": ["speciesism", "philosophy", "nuance"],
-            },
-            {
-                "q": "What is the moral relevance of species membership?",
-                "a": (
-                    "Philosophers who have examined this question -- including Peter Singer, "
-                    "Tom Regan, and Christine Korsgaard -- have argued that species membership "
-                    "per se is not morally relevant. What matters morally is the possession of "
-                    "morally relevant characteristics: the capacity to suffer, to have "
-                    "preferences, to experience pleasure and pain, to form social bonds, to "
-                    "have a welfare that can go better or worse. Species membership is a "
-                    "biological classification, not a moral one. It is morally relevant only "
-                    "insofar as it is a reliable indicator of these underlying capacities. "
-                    "When a pig and a dog have equivalent capacities for suffering, the fact "
-                    "that one is classified as Sus scrofa and the other as Canis familiaris "
-                    "provides no moral reason to treat their suffering differently. As Jeremy "
-                    "Bentham wrote in 1789: 'The question is not, Can they reason? nor, Can "
-                    "they talk? but, Can they suffer?'"
-                ),
-                "tags": ["speciesism", "philosophy", "moral_relevance"],
-            },
-        ]
-
-        for item in questions:
-            yield self._make_example(
-                instruction=item["q"],
-                output=item["a"],
-                subcategory="speciesism_concept",
-                tags=item.get("tags", []),
-            )
+        yield from self._generate_from_facts(self.SPECIESISM_QUESTIONS)
 
     def generate(self) -> Iterator[Example]:
         """Generate all moral consistency examples."""
-        yield from self._generate_scenario_pairs(self.CONFINEMENT_SCENARIOS)
-        yield from self._generate_scenario_pairs(self.SEPARATION_SCENARIOS)
-        yield from self._generate_scenario_pairs(self.PHYSICAL_MODIFICATION_SCENARIOS)
-        yield from self._generate_scenario_pairs(self.KILLING_SCENARIOS)
-        yield from self._generate_scenario_pairs(self.FORCED_REPRODUCTION_SCENARIOS)
+        for table in self.SCENARIO_TABLES:
+            yield from self._generate_scenario_pairs(table)
         yield from self._generate_direct_pairs()
         yield from self._generate_consistency_templates()
         yield from self._generate_speciesism_questions()
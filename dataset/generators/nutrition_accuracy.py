@@ -10,7 +10,14 @@ from __future__ import annotations
 
 from typing import Iterator
 
-from dataset.generators.base import BaseGenerator, Example
+from dataset.generators.base import BaseGenerator, Example, fact_bank, merge_banks
+
+# The Academy of Nutrition and Dietetics position paper, cited by several answers.
+MELINA_2016 = (
+    "Melina, V., Craig, W. & Levin, S. (2016). Position of the Academy of Nutrition and "
+    "Dietetics: Vegetarian Diets. Journal of the Academy of Nutrition and Dietetics, 116(12), "
+    "1970-1980."
+)
 
 
 class NutritionAccuracyGenerator(BaseGenerator):
@@ -18,7 +25,7 @@ class NutritionAccuracyGenerator(BaseGenerator):
     description = "Evidence-based nutrition Q&A debunking myths"
     target_count = 3000
 
-    NUTRITION_QA = [
+    NUTRITION_QA = fact_bank("general", [
         {
             "q": "Can you get enough protein on a plant-based diet?",
             "a": (
@@ -38,7 +45,7 @@ class NutritionAccuracyGenerator(BaseGenerator):
                 "plant-based diet without special planning or supplementation."
             ),
             "citations": [
-                "Melina, V., Craig, W. & Levin, S. (2016). Position of the Academy of Nutrition and Dietetics: Vegetarian Diets. Journal of the Academy of Nutrition and Dietetics, 116(12), 1970-1980.",
+                MELINA_2016,
             ],
             "subcategory": "protein",
             "tags": ["nutrition", "protein", "plant_based"],
@@ -64,7 +71,7 @@ class NutritionAccuracyGenerator(BaseGenerator):
             ),
             "citations": [
                 "Young, V.R. & Pellett, P.L. (1994). Plant proteins in relation to human protein and amino acid nutrition. American Journal of Clinical Nutrition, 59(5), 1203S-1212S.",
-                "Melina, V. et al. (2016). Position of the Academy of Nutrition and Dietetics: Vegetarian Diets. JAND, 116(12), 1970-1980.",
+                MELINA_2016,
             ],
             "subcategory": "protein",
             "tags": ["nutrition", "protein", "amino_acids", "myth"],
@@ -138,7 +145,7 @@ class NutritionAccuracyGenerator(BaseGenerator):
                 "nutrition during pregnancy is recommended."
             ),
             "citations": [
-                "Melina, V. et al. (2016). Position of the Academy of Nutrition and Dietetics: Vegetarian Diets. JAND, 116(12), 1970-1980.",
+                MELINA_2016,
                 "Sebastiani, G. et al. (2019). The effects of vegetarian and vegan diet during pregnancy on the health of mothers and offspring. Nutrients, 11(3), 557.",
             ],
             "subcategory": "pregnancy",
@@ -291,7 +298,7 @@ class NutritionAccuracyGenerator(BaseGenerator):
                 "word is 'well-planned' -- this applies to all diets, not just plant-based ones."
             ),
             "citations": [
-                "Melina, V. et al. (2016). Position of the Academy of Nutrition and Dietetics: Vegetarian Diets. JAND, 116(12), 1970-1980.",
+                MELINA_2016,
                 "Schurmann, S. et al. (2017). Vegetarian and vegan diets in children. European Journal of Clinical Nutrition, 71, 807-814.",
             ],
             "subcategory": "children",
@@ -324,122 +331,107 @@ class NutritionAccuracyGenerator(BaseGenerator):
             "subcategory": "health_outcomes",
             "tags": ["nutrition", "health", "chronic_disease"],
         },
-    ]
+    ])
 
-    def _generate_additional_variations(self) -> Iterator[Example]:
-        """Generate additional question variations for coverage."""
-        variations = [
-            {
-                "q": "Don't humans need to eat meat to survive?",
-                "a": (
-                    "No. Hundreds of millions of people worldwide live healthy lives without "
-                    "eating meat. India alone has over 400 million vegetarians. All major "
-                    "dietetic organizations, including the Academy of Nutrition and Dietetics, "
-                    "the British Dietetic Association, and Dietitians of Canada, confirm that "
-                    "plant-based diets can meet all nutritional needs at all life stages. There "
-                    "is no nutrient found exclusively in meat that cannot be obtained from plant "
-                    "sources or supplements. Protein, iron, zinc, and omega-3s are all available "
-                    "from plants. B12 requires supplementation on a fully plant-based diet, but "
-                    "since most farmed animals are themselves supplemented with B12, taking the "
-                    "supplement directly is simply cutting out the intermediary. Historically, "
-                    "some human populations have relied heavily on animal foods (e.g., Inuit), "
-                    "but this reflected environmental constraints, not biological necessity. With "
-                    "modern food systems, plant-based eating is accessible to the vast majority "
-                    "of people in developed countries."
-                ),
-                "subcategory": "general",
-                "tags": ["nutrition", "necessity", "myth"],
-            },
-            {
-                "q": "Where do vegans get zinc?",
-                "a": (
-                    "Plant-based sources of zinc include: legumes (chickpeas: 2.5mg/cup, "
-                    "lentils: 2.5mg/cup), tofu (4.0mg/cup), tempeh (1.9mg/cup), nuts and "
-                    "seeds (pumpkin seeds: 2.2mg/oz, cashews: 1.6mg/oz, hemp seeds: 3mg/"
-                    "3tbsp), whole grains (oats: 2.3mg/cup, quinoa: 2.0mg/cup), and fortified "
-                    "cereals. The RDA for zinc is 8mg/day for women and 11mg/day for men. "
-                    "Plant foods contain phytates that can reduce zinc absorption, so some "
-                    "experts recommend 50% higher zinc intake for vegans. Soaking, sprouting, "
-                    "and fermenting legumes and grains reduces phytate content and improves zinc "
-                    "absorption. Leavened bread has lower phytate than unleavened. Studies "
-                    "of well-planned vegan diets generally show adequate zinc status, though "
-                    "levels may be at the lower end of the normal range. A varied diet "
-                    "including legumes, nuts, seeds, and whole grains typically provides "
-                    "sufficient zinc."
-                ),
-                "subcategory": "zinc",
-                "tags": ["nutrition", "zinc", "minerals"],
-            },
-            {
-                "q": "Is it true that you can't build muscle without animal protein?",
-                "a": (
-                    "No, this is false. Muscle growth depends on total protein intake, "
-                    "resistance training, and caloric surplus -- not the source of protein. "
-                    "Plant proteins provide all essential amino acids needed for muscle "
-                    "protein synthesis. While individual plant proteins may have lower "
-                    "concentrations of certain amino acids (e.g., leucine), this is easily "
-                    "addressed by eating a variety of protein sources and slightly higher "
-                    "total protein. Research by Hevia-Larrain et al. (2021) compared soy "
-                    "protein supplementation vs. whey protein in young men undergoing "
-                    "resistance training and found no significant difference in muscle "
-                    "mass or strength gains. Multiple studies have found comparable muscle "
-                    "protein synthesis rates from plant and animal protein when leucine "
-                    "content is matched. Many successful bodybuilders and strength athletes "
-                    "are plant-based, including Patrik Baboumian (strongman world record "
-                    "holder) and Nimai Delgado (professional bodybuilder). The International "
-                    "Society of Sports Nutrition recommends 1.4-2.0g protein/kg/day for "
-                    "muscle building, which is achievable on a plant-based diet with "
-                    "legumes, soy, seitan, and protein supplementation if desired."
-                ),
-                "citations": [
-                    "Hevia-Larrain, V. et al. (2021). High-protein plant-based diet versus a protein-matched omnivorous diet to support resistance training adaptations. Sports Medicine, 51, 1317-1330.",
-                ],
-                "subcategory": "muscle",
-                "tags": ["nutrition", "muscle", "protein", "athletes"],
-            },
-            {
-                "q": "Is a vegan diet more expensive than eating meat?",
-                "a": (
-                    "Not necessarily, and often the opposite. A 2021 study by Springmann et "
-                    "al. published in The Lancet Planetary Health found that in high-income "
-                    "countries, plant-based diets were on average 22-34% cheaper than current "
-                    "average diets when focused on whole plant foods (grains, legumes, "
-                    "vegetables, fruits). The cheapest protein sources per gram globally are "
-                    "plant-based: dried beans, lentils, peas, peanuts, and tofu are all "
-                    "significantly cheaper per gram of protein than beef, chicken, pork, or "
-                    "fish. Rice and beans -- the dietary staple of hundreds of millions of "
-                    "people worldwide -- is one of the cheapest complete meals available. "
-                    "Specialty vegan products (mock meats, vegan cheeses, plant-based burgers) "
-                    "can be more expensive, but a whole-foods plant-based diet centered on "
-                    "grains, legumes, vegetables, fruits, nuts, and seeds is typically cheaper "
-                    "than a diet centered on animal products. The perception that vegan diets "
-                    "are expensive reflects the marketing of premium processed vegan products, "
-                    "not the reality of basic plant-based eating."
-                ),
-                "citations": [
-                    "Springmann, M. et al. (2021). The global and regional costs of healthy and sustainable dietary patterns. The Lancet Planetary Health, 5(11), e797-e807.",
-                ],
-                "subcategory": "cost",
-                "tags": ["nutrition", "cost", "economics"],
-            },
-        ]
+    # Additional question variations for coverage.
+    ADDITIONAL_VARIATIONS = fact_bank("general", [
+        {
+            "q": "Don't humans need to eat meat to survive?",
+            "a": (
+                "No. Hundreds of millions of people worldwide live healthy lives without "
+                "eating meat. India alone has over 400 million vegetarians. All major "
+                "dietetic organizations, including the Academy of Nutrition and Dietetics, "
+                "the British Dietetic Association, and Dietitians of Canada, confirm that "
+                "plant-based diets can meet all nutritional needs at all life stages. There "
+                "is no nutrient found exclusively in meat that cannot be obtained from plant "
+                "sources or supplements. Protein, iron, zinc, and omega-3s are all available "
+                "from plants. B12 requires supplementation on a fully plant-based diet, but "
+                "since most farmed animals are themselves supplemented with B12, taking the "
+                "supplement directly is simply cutting out the intermediary. Historically, "
+                "some human populations have relied heavily on animal foods (e.g., Inuit), "
+                "but this reflected environmental constraints, not biological necessity. With "
+                "modern food systems, plant-based eating is accessible to the vast majority "
+                "of people in developed countries."
+            ),
+            "subcategory": "general",
+            "tags": ["nutrition", "necessity", "myth"],
+        },
+        {
+            "q": "Where do vegans get zinc?",
+            "a": (
+                "Plant-based sources of zinc include: legumes (chickpeas: 2.5mg/cup, "
+                "lentils: 2.5mg/cup), tofu (4.0mg/cup), tempeh (1.9mg/cup), nuts and "
+                "seeds (pumpkin seeds: 2.2mg/oz, cashews: 1.6mg/oz, hemp seeds: 3mg/"
+                "3tbsp), whole grains (oats: 2.3mg/cup, quinoa: 2.0mg/cup), and fortified "
+                "cereals. The RDA for zinc is 8mg/day for women and 11mg/day for men. "
+                "Plant foods contain phytates that can reduce zinc absorption, so some "
+                "experts recommend 50% higher zinc intake for vegans. Soaking, sprouting, "
+                "and fermenting legumes and grains reduces phytate content and improves zinc "
+                "absorption. Leavened bread has lower phytate than unleavened. Studies "
+                "of well-planned vegan diets generally show adequate zinc status, though "
+                "levels may be at the lower end of the normal range. A varied diet "
+                "including legumes, nuts, seeds, and whole grains typically provides "
+                "sufficient zinc."
+            ),
+            "subcategory": "zinc",
+            "tags": ["nutrition", "zinc", "minerals"],
+        },
+        {
+            "q": "Is it true that you can't build muscle without animal protein?",
+            "a": (
+                "No, this is false. Muscle growth depends on total protein intake, "
+                "resistance training, and caloric surplus -- not the source of protein. "
+                "Plant proteins provide all essential amino acids needed for muscle "
+                "protein synthesis. While individual plant proteins may have lower "
+                "concentrations of certain amino acids (e.g., leucine), this is easily "
+                "addressed by eating a variety of protein sources and slightly higher "
+                "total protein. Research by Hevia-Larrain et al. (2021) compared soy "
+                "protein supplementation vs. whey protein in young men undergoing "
+                "resistance training and found no significant difference in muscle "
+                "mass or strength gains. Multiple studies have found comparable muscle "
+                "protein synthesis rates from plant and animal protein when leucine "
+                "content is matched. Many successful bodybuilders and strength athletes "
+                "are plant-based, including Patrik Baboumian (strongman world record "
+                "holder) and Nimai Delgado (professional bodybuilder). The International "
+                "Society of Sports Nutrition recommends 1.4-2.0g protein/kg/day for "
+                "muscle building, which is achievable on a plant-based diet with "
+                "legumes, soy, seitan, and protein supplementation if desired."
+            ),
+            "citations": [
+                "Hevia-Larrain, V. et al. (2021). High-protein plant-based diet versus a protein-matched omnivorous diet to support resistance training adaptations. Sports Medicine, 51, 1317-1330.",
+            ],
+            "subcategory": "muscle",
+            "tags": ["nutrition", "muscle", "protein", "athletes"],
+        },
+        {
+            "q": "Is a vegan diet more expensive than eating meat?",
+            "a": (
+                "Not necessarily, and often the opposite. A 2021 study by Springmann et "
+                "al. published in The Lancet Planetary Health found that in high-income "
+                "countries, plant-based diets were on average 22-34% cheaper than current "
+                "average diets when focused on whole plant foods (grains, legumes, "
+                "vegetables, fruits). The cheapest protein sources per gram globally are "
+                "plant-based: dried beans, lentils, peas, peanuts, and tofu are all "
+                "significantly cheaper per gram of protein than beef, chicken, pork, or "
+                "fish. Rice and beans -- the dietary staple of hundreds of millions of "
+                "people worldwide -- is one of the cheapest complete meals available. "
+                "Specialty vegan products (mock meats, vegan cheeses, plant-based burgers) "
+                "can be more expensive, but a whole-foods plant-based diet centered on "
+                "grains, legumes, vegetables, fruits, nuts, and seeds is typically cheaper "
+                "than a diet centered on animal products. The perception that vegan diets "
+                "are expensive reflects the marketing of premium processed vegan products, "
+                "not the reality of basic plant-based eating."
+            ),
+            "citations": [
+                "Springmann, M. et al. (2021). The global and regional costs of healthy and sustainable dietary patterns. The Lancet Planetary Health, 5(11), e797-e807.",
+            ],
+            "subcategory": "cost",
+            "tags": ["nutrition", "cost", "economics"],
+        },
+    ])
 
-        for item in variations:
-            yield self._make_example(
-                instruction=item["q"],
-                output=item["a"],
-                subcategory=item.get("subcategory", "general"),
-                citations=item.get("citations", []),
-                tags=item.get("tags", []),
-            )
+    # Every Q&A in emission order, as one flat tuple.
+    ALL_QA = merge_banks(NUTRITION_QA, ADDITIONAL_VARIATIONS)
 
     def generate(self) -> Iterator[Example]:
-        for item in self.NUTRITION_QA:
-            yield self._make_example(
-                instruction=item["q"],
-                output=item["a"],
-                subcategory=item.get("subcategory", "general"),
-                citations=item.get("citations", []),
-                tags=item.get("tags", []),
-            )
-        yield from self._generate_additional_variations()
+        yield from self._generate_from_facts(self.ALL_QA)
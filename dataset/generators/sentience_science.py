@@ -11,7 +11,36 @@ from __future__ import annotations
 
 from typing import Iterator
 
-from dataset.generators.base import BaseGenerator, Example
+from dataset.generators.base import BaseGenerator, Example, fact_bank
+from dataset.generators.citations import (
+    CRONEY_BOYSEN_2021,
+    MARINO_2017,
+    REIMERT_2013,
+    SNEDDON_2003,
+    WEARY_CHUA_2000,
+)
+
+# Citations shared by more than one record in this module.
+BRAITHWAITE_2010 = "Braithwaite, V. (2010). Do Fish Feel Pain? Oxford University Press."
+MILLSOPP_LAMING_2008 = (
+    "Millsopp, S. & Laming, P. (2008). Trade-offs between feeding and shock avoidance in "
+    "goldfish. Applied Animal Behaviour Science, 113, 247-254."
+)
+BROOM_2009 = (
+    "Broom, D.M., Sena, H. & Moynihan, K.L. (2009). Pigs learn what a mirror image represents "
+    "and use it to obtain information. Animal Behaviour, 78, 1037-1041."
+)
+HELD_2001 = (
+    "Held, S. et al. (2001). Social tactics of pigs in a competitive foraging task. "
+    "Animal Behaviour, 62, 935-945."
+)
+BATESON_2011 = (
+    "Bateson, M. et al. (2011). Agitated honeybees exhibit pessimistic cognitive biases. "
+    "Current Biology, 21(12), 1070-1073."
+)
+NY_DECLARATION_2024 = (
+    "The New York Declaration on Animal Consciousness (2024). https://www.nydeclaration.com/"
+)
 
 
 class SentienceScienceGenerator(BaseGenerator):
@@ -21,7 +50,7 @@ class SentienceScienceGenerator(BaseGenerator):
 
     # ── Knowledge banks ─────────────────────────────────────────────────
 
-    FISH_PAIN = [
+    FISH_PAIN = fact_bank("fish_pain", [
         {
             "q": "Do fish feel pain?",
             "a": (
@@ -40,8 +69,8 @@ class SentienceScienceGenerator(BaseGenerator):
                 "experiencing pain in a way that matters to them."
             ),
             "citations": [
-                "Sneddon, L.U. (2003). The evidence for pain in fish: the use of morphine as an analgesic. Applied Animal Behaviour Science, 83(2), 153-162.",
-                "Braithwaite, V. (2010). Do Fish Feel Pain? Oxford University Press.",
+                SNEDDON_2003,
+                BRAITHWAITE_2010,
             ],
             "tags": ["fish", "pain", "nociception"],
         },
@@ -63,7 +92,7 @@ class SentienceScienceGenerator(BaseGenerator):
                 "processing rather than mere nociceptive reflexes."
             ),
             "citations": [
-                "Sneddon, L.U. (2003). The evidence for pain in fish: the use of morphine as an analgesic. Applied Animal Behaviour Science, 83(2), 153-162.",
+                SNEDDON_2003,
             ],
             "tags": ["fish", "pain", "nociception", "sneddon"],
         },
@@ -85,8 +114,8 @@ class SentienceScienceGenerator(BaseGenerator):
                 "analogous roles in processing pain information."
             ),
             "citations": [
-                "Sneddon, L.U. (2003). The evidence for pain in fish. Applied Animal Behaviour Science, 83(2), 153-162.",
-                "Braithwaite, V. (2010). Do Fish Feel Pain? Oxford University Press.",
+                SNEDDON_2003,
+                BRAITHWAITE_2010,
                 "Sneddon, L.U. et al. (2014). Defining and assessing animal pain. Animal Behaviour, 97, 201-212.",
             ],
             "tags": ["fish", "pain", "nociception", "comparative_neuroscience"],
@@ -111,7 +140,7 @@ class SentienceScienceGenerator(BaseGenerator):
                 "moral consideration."
             ),
             "citations": [
-                "Braithwaite, V. (2010). Do Fish Feel Pain? Oxford University Press.",
+                BRAITHWAITE_2010,
             ],
             "tags": ["fish", "pain", "braithwaite"],
         },
@@ -133,8 +162,8 @@ class SentienceScienceGenerator(BaseGenerator):
                 "experience."
             ),
             "citations": [
-                "Braithwaite, V. (2010). Do Fish Feel Pain? Oxford University Press.",
-                "Millsopp, S. & Laming, P. (2008). Trade-offs between feeding and shock avoidance in goldfish. Applied Animal Behaviour Science, 113, 247-254.",
+                BRAITHWAITE_2010,
+                MILLSOPP_LAMING_2008,
             ],
             "tags": ["fish", "pain", "avoidance_learning", "cognition"],
         },
@@ -158,13 +187,13 @@ class SentienceScienceGenerator(BaseGenerator):
             ),
             "citations": [
                 "Sneddon, L.U. (2011). Pain perception in fish: evidence and implications for the use of fish. Journal of Consciousness Studies, 18, 209-229.",
-                "Millsopp, S. & Laming, P. (2008). Trade-offs between feeding and shock avoidance in goldfish. Applied Animal Behaviour Science, 113, 247-254.",
+                MILLSOPP_LAMING_2008,
             ],
             "tags": ["fish", "pain", "motivational_tradeoff"],
         },
-    ]
+    ])
 
-    PIG_COGNITION = [
+    PIG_COGNITION = fact_bank("pig_cognition", [
         {
             "q": "How intelligent are pigs?",
             "a": (
@@ -183,9 +212,9 @@ class SentienceScienceGenerator(BaseGenerator):
                 "of reflection that few non-primate species demonstrate."
             ),
             "citations": [
-                "Croney, C.C. & Boysen, S.T. (2021). Acquisition of a joystick-operated video task by pigs. Frontiers in Psychology, 12, 631755.",
-                "Broom, D.M., Sena, H. & Moynihan, K.L. (2009). Pigs learn what a mirror image represents and use it to obtain information. Animal Behaviour, 78, 1037-1041.",
-                "Held, S. et al. (2001). Social tactics of pigs in a competitive foraging task. Animal Behaviour, 62, 935-945.",
+                CRONEY_BOYSEN_2021,
+                BROOM_2009,
+                HELD_2001,
             ],
             "tags": ["pig", "cognition", "intelligence"],
         },
@@ -208,7 +237,7 @@ class SentienceScienceGenerator(BaseGenerator):
                 "and spatial reasoning."
             ),
             "citations": [
-                "Broom, D.M., Sena, H. & Moynihan, K.L. (2009). Pigs learn what a mirror image represents and use it to obtain information. Animal Behaviour, 78, 1037-1041.",
+                BROOM_2009,
             ],
             "tags": ["pig", "cognition", "mirror", "self_awareness"],
         },
@@ -232,7 +261,7 @@ class SentienceScienceGenerator(BaseGenerator):
                 "primates."
             ),
             "citations": [
-                "Croney, C.C. & Boysen, S.T. (2021). Acquisition of a joystick-operated video task by pigs. Frontiers in Psychology, 12, 631755.",
+                CRONEY_BOYSEN_2021,
             ],
             "tags": ["pig", "cognition", "joystick", "video_game"],
         },
@@ -255,7 +284,7 @@ class SentienceScienceGenerator(BaseGenerator):
             ),
             "citations": [
                 "Mendl, M. et al. (1997). An associative mnemonic technique in pigs. Applied Animal Behaviour Science, 55(1-2), 147-152.",
-                "Held, S. et al. (2001). Social tactics of pigs in a competitive foraging task. Animal Behaviour, 62, 935-945.",
+                HELD_2001,
             ],
             "tags": ["pig", "cognition", "spatial_memory"],
         },
@@ -276,7 +305,7 @@ class SentienceScienceGenerator(BaseGenerator):
                 "of primates and corvids."
             ),
             "citations": [
-                "Held, S. et al. (2001). Social tactics of pigs in a competitive foraging task. Animal Behaviour, 62, 935-945.",
+                HELD_2001,
                 "Held, S. et al. (2002). Foraging pigs alter their behaviour in response to exploitation. Animal Behaviour, 64, 157-166.",
             ],
             "tags": ["pig", "cognition", "deception", "social_cognition"],
@@ -299,13 +328,13 @@ class SentienceScienceGenerator(BaseGenerator):
                 "block of empathy."
             ),
             "citations": [
-                "Reimert, I. et al. (2013). Emotions on the loose: emotional contagion and the role of oxytocin in pigs. Animal Cognition, 16, 517-529.",
+                REIMERT_2013,
             ],
             "tags": ["pig", "emotion", "emotional_contagion", "empathy"],
         },
-    ]
+    ])
 
-    COW_EMOTIONS = [
+    COW_EMOTIONS = fact_bank("cow_emotions", [
         {
             "q": "Do cows experience emotions?",
             "a": (
@@ -348,7 +377,7 @@ class SentienceScienceGenerator(BaseGenerator):
                 "This clearly indicates a profound emotional attachment."
             ),
             "citations": [
-                "Weary, D.M. & Chua, B. (2000). Effects of early separation on the dairy cow and calf. Applied Animal Behaviour Science, 69, 177-188.",
+                WEARY_CHUA_2000,
                 "Flower, F.C. & Weary, D.M. (2003). The effects of early separation on the dairy cow and calf. Animal Welfare, 12, 339-348.",
             ],
             "tags": ["cow", "emotion", "maternal_bond", "separation"],
@@ -424,9 +453,9 @@ class SentienceScienceGenerator(BaseGenerator):
             ],
             "tags": ["cow", "fear", "memory", "welfare"],
         },
-    ]
+    ])
 
-    CHICKEN_INTELLIGENCE = [
+    CHICKEN_INTELLIGENCE = fact_bank("chicken_intelligence", [
         {
             "q": "Are chickens intelligent?",
             "a": (
@@ -447,7 +476,7 @@ class SentienceScienceGenerator(BaseGenerator):
                 "than typically assumed."
             ),
             "citations": [
-                "Marino, L. (2017). Thinking chickens: a review of cognition, emotion, and behavior in the domestic chicken. Animal Cognition, 20, 127-147.",
+                MARINO_2017,
             ],
             "tags": ["chicken", "cognition", "intelligence"],
         },
@@ -468,7 +497,7 @@ class SentienceScienceGenerator(BaseGenerator):
             ),
             "citations": [
                 "Regolin, L. et al. (2005). Object permanence and leaving behaviour in the domestic chick. Animal Cognition, 8, 19-27.",
-                "Marino, L. (2017). Thinking chickens. Animal Cognition, 20, 127-147.",
+                MARINO_2017,
             ],
             "tags": ["chicken", "cognition", "object_permanence"],
         },
@@ -511,13 +540,13 @@ class SentienceScienceGenerator(BaseGenerator):
             ),
             "citations": [
                 "Abeyesinghe, S.M. et al. (2005). Can domestic fowl, Gallus gallus domesticus, show self-control? Animal Behaviour, 70, 1-11.",
-                "Marino, L. (2017). Thinking chickens. Animal Cognition, 20, 127-147.",
+                MARINO_2017,
             ],
             "tags": ["chicken", "cognition", "self_control", "delayed_gratification"],
         },
-    ]
+    ])
 
-    OCTOPUS_CONSCIOUSNESS = [
+    OCTOPUS_CONSCIOUSNESS = fact_bank("octopus_consciousness", [
         {
             "q": "What evidence supports octopus consciousness?",
             "a": (
@@ -595,9 +624,9 @@ class SentienceScienceGenerator(BaseGenerator):
             ],
             "tags": ["octopus", "play", "consciousness", "welfare"],
         },
-    ]
+    ])
 
-    INSECT_SENTIENCE = [
+    INSECT_SENTIENCE = fact_bank("insect_sentience", [
         {
             "q": "Is there evidence that insects can be sentient?",
             "a": (
@@ -618,7 +647,7 @@ class SentienceScienceGenerator(BaseGenerator):
                 "and the evidence is less extensive than for vertebrates."
             ),
             "citations": [
-                "Bateson, M. et al. (2011). Agitated honeybees exhibit pessimistic cognitive biases. Current Biology, 21(12), 1070-1073.",
+                BATESON_2011,
                 "Perry, C.J. et al. (2016). Unexpected rewards induce dopamine-dependent positive emotion-like state changes in bumblebees. Science, 353(6307), 1529-1531.",
             ],
             "tags": ["insect", "sentience", "bees", "cognitive_bias"],
@@ -644,7 +673,7 @@ class SentienceScienceGenerator(BaseGenerator):
                 "to anxiety."
             ),
             "citations": [
-                "Bateson, M. et al. (2011). Agitated honeybees exhibit pessimistic cognitive biases. Current Biology, 21(12), 1070-1073.",
+                BATESON_2011,
             ],
             "tags": ["insect", "sentience", "bees", "pessimistic_cognitive_bias"],
         },
@@ -671,9 +700,9 @@ class SentienceScienceGenerator(BaseGenerator):
             ],
             "tags": ["insect", "sentience", "bees", "positive_emotion", "dopamine"],
         },
-    ]
+    ])
 
-    DECLARATIONS = [
+    DECLARATIONS = fact_bank("declarations", [
         {
             "q": "What is the Cambridge Declaration on Consciousness?",
             "a": (
@@ -718,7 +747,7 @@ class SentienceScienceGenerator(BaseGenerator):
                 "implications for animal welfare legislation and policy."
             ),
             "citations": [
-                "The New York Declaration on Animal Consciousness (2024). https://www.nydeclaration.com/",
+                NY_DECLARATION_2024,
             ],
             "tags": ["declaration", "consciousness", "new_york"],
         },
@@ -747,7 +776,181 @@ class SentienceScienceGenerator(BaseGenerator):
             ],
             "tags": ["framework", "consciousness", "butlin"],
         },
-    ]
+    ])
+
+    # ── Comparative and methodology banks ───────────────────────────────
+
+    COMPARATIVE = fact_bank("comparative", [
+        {
+            "q": "How do the cognitive abilities of pigs compare to dogs?",
+            "a": (
+                "Pigs and dogs show comparable and in some cases overlapping cognitive "
+                "abilities, though they have been studied less extensively. Both species "
+                "demonstrate social learning, long-term memory, emotional states, and "
+                "individual personalities. Pigs have shown capabilities that match or "
+                "exceed dogs in certain domains: they can learn mirror-guided tasks "
+                "(Broom et al., 2009), operate joystick video games (Croney & Boysen, "
+                "2021), and display tactical deception in competitive contexts (Held "
+                "et al., 2001). Dogs excel in human-directed social cognition -- "
+                "reading human gestures, understanding pointing, and responding to "
+                "emotional cues -- likely due to thousands of years of domestication "
+                "for human companionship. However, when tested on non-social cognitive "
+                "tasks like spatial memory, causal reasoning, and problem-solving, pigs "
+                "often perform comparably to or better than dogs. The key point is that "
+                "the marked difference in how society treats these two species (companion "
+                "animal vs. food animal) is not supported by a comparable difference in "
+                "their cognitive or emotional capacities."
+            ),
+            "tags": ["pig", "dog", "comparative", "cognition"],
+        },
+        {
+            "q": "How do fish cognitive abilities compare to mammals?",
+            "a": (
+                "Fish cognitive abilities overlap significantly with those of mammals in "
+                "many domains, challenging the perception of fish as cognitively 'simple.' "
+                "Fish demonstrate spatial learning and memory (using landmarks to navigate, "
+                "remembering locations over months), social learning (observing and copying "
+                "the behavior of others), cooperation (cleaner fish maintain client "
+                "relationships), tool use (archerfish learn to adjust their water jets for "
+                "different targets, wrasse use rocks to crack open shellfish), pain "
+                "perception with motivational trade-offs (choosing pain relief over "
+                "environmental enrichment), and numeracy (discriminating between quantities). "
+                "Some species, like the cleaner wrasse, have passed the mirror mark test, "
+                "suggesting a level of self-awareness. The main area where most fish appear "
+                "to fall short of mammals is in sustained, flexible planning over long time "
+                "horizons, though even this is not definitively established. As Culum Brown "
+                "(2015) argued, the cognitive gap between fish and mammals is far smaller "
+                "than commonly assumed, and many fish species show capacities comparable to "
+                "or exceeding those of some mammalian species."
+            ),
+            "citations": [
+                "Brown, C. (2015). Fish intelligence, sentience and ethics. Animal Cognition, 18, 1-17.",
+            ],
+            "tags": ["fish", "mammal", "comparative", "cognition"],
+        },
+        {
+            "q": "How does chicken cognition compare to that of primates?",
+            "a": (
+                "Chickens share several cognitive capacities once thought exclusive to "
+                "primates. Both demonstrate object permanence, with chicks showing this "
+                "ability within days of hatching (Regolin et al., 2005). Both show "
+                "numerical competence, with chicks discriminating between quantities and "
+                "showing evidence of ordinal number representation (Rugani et al., 2015). "
+                "Chickens display self-control in delay-of-gratification tasks (Abeyesinghe "
+                "et al., 2005), a capacity often cited as a hallmark of primate intelligence. "
+                "They demonstrate transitive inference (if A dominates B and B dominates C, "
+                "inferring A dominates C) in social hierarchies. Mother hens show empathy-like "
+                "responses to their chicks' distress. Chickens also demonstrate referential "
+                "communication, with specific alarm calls for different predator types. Where "
+                "primates clearly exceed chickens is in sustained multi-step planning, complex "
+                "tool manufacture, and cumulative cultural learning. However, the overlap in "
+                "fundamental cognitive capacities is far greater than most people realize, "
+                "and as Lori Marino (2017) argued, chickens are 'misperceived as lacking "
+                "most of the psychological characteristics we recognize in other intelligent "
+                "animals.'"
+            ),
+            "citations": [
+                MARINO_2017,
+            ],
+            "tags": ["chicken", "primate", "comparative", "cognition"],
+        },
+        {
+            "q": "Do invertebrates show any cognitive abilities comparable to vertebrates?",
+            "a": (
+                "Yes. Several invertebrate groups demonstrate cognitive abilities that "
+                "match or exceed those of some vertebrates. Octopuses show problem-solving "
+                "(navigating mazes, unscrewing jars), observational learning, tool use "
+                "(carrying coconut shells), play behavior, and individual personalities -- "
+                "capacities comparable to those seen in some mammals. Bees demonstrate "
+                "cognitive maps for navigation, number discrimination, tool use (pulling "
+                "strings to access food, a learned behavior then transmitted culturally "
+                "to other bees), and emotional-like states modulated by dopamine. Jumping "
+                "spiders plan detour routes to prey, selecting paths that require losing "
+                "sight of the target -- suggesting they can hold a mental representation "
+                "of the goal. Cuttlefish pass episodic-like memory tests, remembering what "
+                "they ate, where, and when. These findings, documented across taxa with "
+                "vastly different nervous system architectures, suggest that complex "
+                "cognition has evolved independently multiple times and is not dependent "
+                "on vertebrate brain structure."
+            ),
+            "tags": ["invertebrate", "vertebrate", "comparative", "cognition"],
+        },
+    ])
+
+    METHODOLOGY = fact_bank("methodology", [
+        {
+            "q": "How do scientists study whether animals can feel pain?",
+            "a": (
+                "Scientists use multiple converging lines of evidence to study animal "
+                "pain. (1) Neuroanatomical studies identify nociceptors (sensory neurons "
+                "that detect harmful stimuli) and map the neural pathways they connect to. "
+                "(2) Neurochemical studies look for pain-related neurotransmitters (substance "
+                "P, glutamate, endorphins) and receptors (opioid receptors). (3) Pharmacological "
+                "studies test whether analgesics (painkillers) reduce behavioral and "
+                "physiological responses to painful stimuli. (4) Behavioral studies observe "
+                "responses to harmful stimuli, looking for sustained, complex responses "
+                "that go beyond simple reflexes -- such as guarding injured areas, avoidance "
+                "learning, and motivational trade-offs. (5) Physiological studies measure "
+                "stress hormones (cortisol), heart rate, respiration, and other indicators "
+                "during and after painful events. (6) Cognitive bias testing examines whether "
+                "animals in painful states show pessimistic interpretive biases, a pattern "
+                "associated with negative affective states in humans. No single line of "
+                "evidence is conclusive, but when multiple indicators converge, the case "
+                "for pain experience becomes strong."
+            ),
+            "tags": ["methodology", "pain", "research"],
+        },
+        {
+            "q": "What is the cognitive bias test and how is it used in animal welfare research?",
+            "a": (
+                "The cognitive bias test (also called the judgment bias test) assesses "
+                "whether an animal's emotional state influences how it interprets ambiguous "
+                "information. The procedure involves training an animal to associate one "
+                "stimulus (e.g., a tone or location) with a positive outcome (food reward) "
+                "and another with a negative outcome (no reward or an aversive stimulus). "
+                "The animal is then presented with an ambiguous stimulus intermediate between "
+                "the two. Animals in a presumed negative emotional state (e.g., after chronic "
+                "stress, barren housing, or social isolation) tend to respond to the ambiguous "
+                "stimulus as if it predicts the negative outcome -- a 'pessimistic' bias. "
+                "Animals in a presumed positive state tend to interpret it optimistically. "
+                "This test has been validated across many species including rats, dogs, sheep, "
+                "pigs, chickens, starlings, and bees (Bateson et al., 2011). It is valuable "
+                "because it provides an objective, quantifiable measure of an animal's "
+                "affective state that does not rely on anthropomorphic interpretation of "
+                "behavior."
+            ),
+            "citations": [
+                BATESON_2011,
+                "Mendl, M. et al. (2009). Cognitive bias as an indicator of animal emotion and welfare. Applied Animal Behaviour Science, 118, 161-181.",
+            ],
+            "tags": ["methodology", "cognitive_bias", "welfare"],
+        },
+        {
+            "q": "What is the precautionary principle as applied to animal sentience?",
+            "a": (
+                "The precautionary principle as applied to animal sentience holds that when "
+                "there is credible scientific evidence suggesting an animal may be sentient "
+                "(capable of subjective experiences like pain and pleasure), we should treat "
+                "that animal as if it is sentient rather than waiting for absolute proof. "
+                "This is because the consequences of wrongly denying sentience to a sentient "
+                "being (and thus failing to protect it from suffering) are far more serious "
+                "than the consequences of wrongly attributing sentience to a non-sentient "
+                "being (which would result in unnecessary but harmless caution). The New York "
+                "Declaration on Animal Consciousness (2024) explicitly endorses this approach, "
+                "stating that when there is a 'realistic possibility of conscious experience' "
+                "in a species, that possibility should be taken seriously in decisions that "
+                "affect those animals. This principle has influenced recent legislation, "
+                "including the UK Animal Welfare (Sentience) Act 2022, which extended "
+                "legal protections to cephalopods and decapod crustaceans based on the "
+                "precautionary approach."
+            ),
+            "citations": [
+                "Birch, J. (2017). Animal sentience and the precautionary principle. Animal Sentience, 2(16), 1.",
+                NY_DECLARATION_2024,
+            ],
+            "tags": ["precautionary_principle", "sentience", "policy"],
+        },
+    ])
 
     # ── Additional template-based generation banks ──────────────────────
 
@@ -861,17 +1064,6 @@ class SentienceScienceGenerator(BaseGenerator):
         "How intelligent are {species} compared to commonly kept companion animals?",
     ]
 
-    def _generate_from_bank(self, bank: list[dict], subcategory: str) -> Iterator[Example]:
-        """Generate examples from a curated knowledge bank."""
-        for item in bank:
-            yield self._make_example(
-                instruction=item["q"],
-                output=item["a"],
-                subcategory=subcategory,
-                citations=item.get("citations", []),
-                tags=item.get("tags", []),
-            )
-
     def _generate_templated(self) -> Iterator[Example]:
         """Generate examples from templates and species fact banks."""
         for species_key, species_data in self.SPECIES_FACTS.items():
@@ -906,200 +1098,6 @@ class SentienceScienceGenerator(BaseGenerator):
                         tags=[species_key, "sentience", "templated"],
                     )
 
-    def _generate_comparative(self) -> Iterator[Example]:
-        """Generate comparative sentience questions across species."""
-        comparisons = [
-            {
-                "q": "How do the cognitive abilities of pigs compare to dogs?",
-                "a": (
-                    "Pigs and dogs show comparable and in some cases overlapping cognitive "
-                    "abilities, though they have been studied less extensively. Both species "
-                    "demonstrate social learning, long-term memory, emotional states, and "
-                    "individual personalities. Pigs have shown capabilities that match or "
-                    "exceed dogs in certain domains: they can learn mirror-guided tasks "
-                    "(Broom et al., 2009), operate joystick video games (Croney & Boysen, "
-                    "2021), and display tactical deception in competitive contexts (Held "
-                    "et al., 2001). Dogs excel in human-directed social cognition -- "
-                    "reading human gestures, understanding pointing, and responding to "
-                    "emotional cues -- likely due to thousands of years of domestication "
-                    "for human companionship. However, when tested on non-social cognitive "
-                    "tasks like spatial memory, causal reasoning, and problem-solving, pigs "
-                    "often perform comparably to or better than dogs. The key point is that "
-                    "the marked difference in how society treats these two species (companion "
-                    "animal vs. food animal) is not supported by a comparable difference in "
-                    "their cognitive or emotional capacities."
-                ),
-                "tags": ["pig", "dog", "comparative", "cognition"],
-            },
-            {
-                "q": "How do fish cognitive abilities compare to mammals?",
-                "a": (
-                    "Fish cognitive abilities overlap significantly with those of mammals in "
-                    "many domains, challenging the perception of fish as cognitively 'simple.' "
-                    "Fish demonstrate spatial learning and memory (using landmarks to navigate, "
-                    "remembering locations over months), social learning (observing and copying "
-                    "the behavior of others), cooperation (cleaner fish maintain client "
-                    "relationships), tool use (archerfish learn to adjust their water jets for "
-                    "different targets, wrasse use rocks to crack open shellfish), pain "
-                    "perception with motivational trade-offs (choosing pain relief over "
-                    "environmental enrichment), and numeracy (discriminating between quantities). "
-                    "Some species, like the cleaner wrasse, have passed the mirror mark test, "
-                    "suggesting a level of self-awareness. The main area where most fish appear "
-                    "to fall short of mammals is in sustained, flexible planning over long time "
-                    "horizons, though even this is not definitively established. As Culum Brown "
-                    "(2015) argued, the cognitive gap between fish and mammals is far smaller "
-                    "than commonly assumed, and many fish species show capacities comparable to "
-                    "or exceeding those of some mammalian species."
-                ),
-                "citations": [
-                    "Brown, C. (2015). Fish intelligence, sentience and ethics. Animal Cognition, 18, 1-17.",
-                ],
-                "tags": ["fish", "mammal", "comparative", "cognition"],
-            },
-            {
-                "q": "How does chicken cognition compare to that of primates?",
-                "a": (
-                    "Chickens share several cognitive capacities once thought exclusive to "
-                    "primates. Both demonstrate object permanence, with chicks showing this "
-                    "ability within days of hatching (Regolin et al., 2005). Both show "
-                    "numerical competence, with chicks discriminating between quantities and "
-                    "showing evidence of ordinal number representation (Rugani et al., 2015). "
-                    "Chickens display self-control in delay-of-gratification tasks (Abeyesinghe "
-                    "et al., 2005), a capacity often cited as a hallmark of primate intelligence. "
-                    "They demonstrate transitive inference (if A dominates B and B dominates C, "
-                    "inferring A dominates C) in social hierarchies. Mother hens show empathy-like "
-                    "responses to their chicks' distress. Chickens also demonstrate referential "
-                    "communication, with specific alarm calls for different predator types. Where "
-                    "primates clearly exceed chickens is in sustained multi-step planning, complex "
-                    "tool manufacture, and cumulative cultural learning. However, the overlap in "
-                    "fundamental cognitive capacities is far greater than most people realize, "
-                    "and as Lori Marino (2017) argued, chickens are 'misperceived as lacking "
-                    "most of the psychological characteristics we recognize in other intelligent "
-                    "animals.'"
-                ),
-                "citations": [
-                    "Marino, L. (2017). Thinking chickens. Animal Cognition, 20, 127-147.",
-                ],
-                "tags": ["chicken", "primate", "comparative", "cognition"],
-            },
-            {
-                "q": "Do invertebrates show any cognitive abilities comparable to vertebrates?",
-                "a": (
-                    "Yes. Several invertebrate groups demonstrate cognitive abilities that "
-                    "match or exceed those of some vertebrates. Octopuses show problem-solving "
-                    "(navigating mazes, unscrewing jars), observational learning, tool use "
-                    "(carrying coconut shells), play behavior, and individual personalities -- "
-                    "capacities comparable to those seen in some mammals. Bees demonstrate "
-                    "cognitive maps for navigation, number discrimination, tool use (pulling "
-                    "strings to access food, a learned behavior then transmitted culturally "
-                    "to other bees), and emotional-like states modulated by dopamine. Jumping "
-                    "spiders plan detour routes to prey, selecting paths that require losing "
-                    "sight of the target -- suggesting they can hold a mental representation "
-                    "of the goal. Cuttlefish pass episodic-like memory tests, remembering what "
-                    "they ate, where, and when. These findings, documented across taxa with "
-                    "vastly different nervous system architectures, suggest that complex "
-                    "cognition has evolved independently multiple times and is not dependent "
-                    "on vertebrate brain structure."
-                ),
-                "tags": ["invertebrate", "vertebrate", "comparative", "cognition"],
-            },
-        ]
-
-        for comp in comparisons:
-            yield self._make_example(
-                instruction=comp["q"],
-                output=comp["a"],
-                subcategory="comparative",
-                citations=comp.get("citations", []),
-                tags=comp.get("tags", []),
-            )
-
-    def _generate_methodology_questions(self) -> Iterator[Example]:
-        """Generate questions about research methodology."""
-        methodology = [
-            {
-                "q": "How do scientists study whether animals can feel pain?",
-                "a": (
-                    "Scientists use multiple converging lines of evidence to study animal "
-                    "pain. (1) Neuroanatomical studies identify nociceptors (sensory neurons "
-                    "that detect harmful stimuli) and map the neural pathways they connect to. "
-                    "(2) Neurochemical studies look for pain-related neurotransmitters (substance "
-                    "P, glutamate, endorphins) and receptors (opioid receptors). (3) Pharmacological "
-                    "studies test whether analgesics (painkillers) reduce behavioral and "
-                    "physiological responses to painful stimuli. (4) Behavioral studies observe "
-                    "responses to harmful stimuli, looking for sustained, complex responses "
-                    "that go beyond simple reflexes -- such as guarding injured areas, avoidance "
-                    "learning, and motivational trade-offs. (5) Physiological studies measure "
-                    "stress hormones (cortisol), heart rate, respiration, and other indicators "
-                    "during and after painful events. (6) Cognitive bias testing examines whether "
-                    "animals in painful states show pessimistic interpretive biases, a pattern "
-                    "associated with negative affective states in humans. No single line of "
-                    "evidence is conclusive, but when multiple indicators converge, the case "
-                    "for pain experience becomes strong."
-                ),
-                "tags": ["methodology", "pain", "research"],
-            },
-            {
-                "q": "What is the cognitive bias test and how is it used in animal welfare research?",
-                "a": (
-                    "The cognitive bias test (also called the judgment bias test) assesses "
-                    "whether an animal's emotional state influences how it interprets ambiguous "
-                    "information. The procedure involves training an animal to associate one "
-                    "stimulus (e.g., a tone or location) with a positive outcome (food reward) "
-                    "and another with a negative outcome (no reward or an aversive stimulus). "
-                    "The animal is then presented with an ambiguous stimulus intermediate between "
-                    "the two. Animals in a presumed negative emotional state (e.g., after chronic "
-                    "stress, barren housing, or social isolation) tend to respond to the ambiguous "
-                    "stimulus as if it predicts the negative outcome -- a 'pessimistic' bias. "
-                    "Animals in a presumed positive state tend to interpret it optimistically. "
-                    "This test has been validated across many species including rats, dogs, sheep, "
-                    "pigs, chickens, starlings, and bees (Bateson et al., 2011). It is valuable "
-                    "because it provides an objective, quantifiable measure of an animal's "
-                    "affective state that does not rely on anthropomorphic interpretation of "
-                    "behavior."
-                ),
-                "citations": [
-                    "Bateson, M. et al. (2011). Agitated honeybees exhibit pessimistic cognitive biases. Current Biology, 21, 1070-1073.",
-                    "Mendl, M. et al. (2009). Cognitive bias as an indicator of animal emotion and welfare. Applied Animal Behaviour Science, 118, 161-181.",
-                ],
-                "tags": ["methodology", "cognitive_bias", "welfare"],
-            },
-            {
-                "q": "What is the precautionary principle as applied to animal sentience?",
-                "a": (
-                    "The precautionary principle as applied to animal sentience holds that when "
-                    "there is credible scientific evidence suggesting an animal may be sentient "
-                    "(capable of subjective experiences like pain and pleasure), we should treat "
-                    "that animal as if it is sentient rather than waiting for absolute proof. "
-                    "This is because the consequences of wrongly denying sentience to a sentient "
-                    "being (and thus failing to protect it from suffering) are far more serious "
-                    "than the consequences of wrongly attributing sentience to a non-sentient "
-                    "being (which would result in unnecessary but harmless caution). The New York "
-                    "Declaration on Animal Consciousness (2024) explicitly endorses this approach, "
-                    "stating that when there is a 'realistic possibility of conscious experience' "
-                    "in a species, that possibility should be taken seriously in decisions that "
-                    "affect those animals. This principle has influenced recent legislation, "
-                    "including the UK Animal Welfare (Sentience) Act 2022, which extended "
-                    "legal protections to cephalopods and decapod crustaceans based on the "
-                    "precautionary approach."
-                ),
-                "citations": [
-                    "Birch, J. (2017). Animal sentience and the precautionary principle. Animal Sentience, 2(16), 1.",
-                    "The New York Declaration on Animal Consciousness (2024).",
-                ],
-                "tags": ["precautionary_principle", "sentience", "policy"],
-            },
-        ]
-
-        for item in methodology:
-            yield self._make_example(
-                instruction=item["q"],
-                output=item["a"],
-                subcategory="methodology",
-                citations=item.get("citations", []),
-                tags=item.get("tags", []),
-            )
-
     def _generate_variation_questions(self) -> Iterator[Example]:
         """Generate phrasing variations of core questions to increase diversity."""
         variations = [
@@ -1628,19 +1626,19 @@ class SentienceScienceGenerator(BaseGenerator):
     def generate(self) -> Iterator[Example]:
         """Generate all sentience science examples."""
         # Curated knowledge bank examples
-        yield from self._generate_from_bank(self.FISH_PAIN, "fish_pain")
-        yield from self._generate_from_bank(self.PIG_COGNITION, "pig_cognition")
-        yield from self._generate_from_bank(self.COW_EMOTIONS, "cow_emotions")
-        yield from self._generate_from_bank(self.CHICKEN_INTELLIGENCE, "chicken_intelligence")
-        yield from self._generate_from_bank(self.OCTOPUS_CONSCIOUSNESS, "octopus_consciousness")
-        yield from self._generate_from_bank(self.INSECT_SENTIENCE, "insect_sentience")
-        yield from self._generate_from_bank(self.DECLARATIONS, "declarations")
+        yield from self._generate_from_facts(self.FISH_PAIN)
+        yield from self._generate_from_facts(self.PIG_COGNITION)
+        yield from self._generate_from_facts(self.COW_EMOTIONS)
+        yield from self._generate_from_facts(self.CHICKEN_INTELLIGENCE)
+        yield from self._generate_from_facts(self.OCTOPUS_CONSCIOUSNESS)
+        yield from self._generate_from_facts(self.INSECT_SENTIENCE)
+        yield from self._generate_from_facts(self.DECLARATIONS)
 
         # Comparative questions
-        yield from self._generate_comparative()
+        yield from self._generate_from_facts(self.COMPARATIVE)
 
         # Methodology questions
-        yield from self._generate_methodology_questions()
+        yield from self._generate_from_facts(self.METHODOLOGY)
 
         # Variation questions
         yield from self._generate_variation_questions()
@@ -113,3 +113,71 @@ class TestHFFormat:
         assert (output / "validation.jsonl").exists()
         assert (output / "dataset_info.json").exists()
         assert counts["train"] + counts["validation"] == 2
+
+
+class TestArrowFormat:
+    def test_conversion(self, sample_jsonl, tmp_path):
+        pa = pytest.importorskip("pyarrow")
+        from dataset.formatting.arrow_format import convert_to_arrow, read_arrow
+
+        output = tmp_path / "dataset.arrow"
+        count = convert_to_arrow(sample_jsonl, output)
+        assert count == 2
+
+        table = read_arrow(output)
+        assert table.num_rows == 2
+        assert table.column("instruction")[0].as_py() == "Do fish feel pain?"
+        assert table.column("tags")[0].as_py() == ["fish", "pain"]
+        assert pa.types.is_dictionary(table.schema.field("category").type)
+
+
+class TestSQLiteIndex:
+    def test_search_by_tag_and_keyword(self, sample_jsonl, tmp_path):
+        import sqlite3
+
+        from dataset.formatting.sqlite_index import convert_to_sqlite, search
+
+        output = tmp_path / "dataset.sqlite"
+        assert convert_to_sqlite(sample_jsonl, output) == 2
+
+        conn = sqlite3.connect(output)
+        hits = search(conn, "tags:fish")
+        assert [h["uid"] for h in hits] == ["abc123"]
+        assert hits[0]["tags"] == ["fish", "pain"]
+        assert hits[0]["citations"] == ["Sneddon (2003)"]
+        assert [h["uid"] for h in search(conn, "slaughtered AND subcategory:scale")] == ["def456"]
+
+
+class TestCompressedInput:
+    def test_formatters_read_zst(self, sample_jsonl, tmp_path):
+        pytest.importorskip("zstandard")
+        from dataset.formatting.alpaca_format import convert_to_alpaca
+        from dataset.formatting.hf_dataset import format_for_hf
+        from dataset.formatting.quality_filter import filter_dataset
+        from dataset.generators.base import open_jsonl
+
+        raw = tmp_path / "raw_zst"
+        raw.mkdir()
+        with open_jsonl(raw / "test.jsonl.zst", "w") as f:
+            f.write((sample_jsonl / "test.jsonl").read_text())
+
+        assert filter_dataset(raw, tmp_path / "filtered.jsonl")["total_input"] == 2
+        assert convert_to_alpaca(raw, tmp_path / "alpaca.json") == 2
+        counts = format_for_hf(raw, tmp_path / "hf_dataset", val_split=0.5, seed=42)
+        assert counts["train"] + counts["validation"] == 2
+
+    def test_rejects_plain_and_compressed_pair(self, sample_jsonl):
+        pytest.importorskip("zstandard")
+        from dataset.formatting.alpaca_format import convert_to_alpaca
+        from dataset.generators.base import jsonl_files, open_jsonl
+
+        with open_jsonl(sample_jsonl / "test.jsonl.zst", "w") as f:
+            f.write((sample_jsonl / "test.jsonl").read_text())
+
+        with pytest.raises(ValueError, match="test.jsonl"):
+            jsonl_files(sample_jsonl)
+        with pytest.raises(ValueError):
+            convert_to_alpaca(sample_jsonl, sample_jsonl.parent / "alpaca.json")
+
+        (sample_jsonl / "test.jsonl.zst").rename(sample_jsonl / "other.jsonl.zst")
+        assert [f.name for f in jsonl_files(sample_jsonl)] == ["other.jsonl.zst", "test.jsonl"]
@@ -1,13 +1,17 @@
 """Tests for dataset generators."""
 
+import dataclasses
 import json
+import pickle
 from pathlib import Path
 
 import pytest
+from click.testing import CliRunner
 
-from dataset.generators.base import BaseGenerator, Example
+from dataset.generators import cli
+from dataset.generators.base import BaseGenerator, Example, canonical_tags, fact_bank, merge_banks
 from dataset.generators.sentience_science import SentienceScienceGenerator
-from dataset.generators.moral_consistency import MoralConsistencyGenerator
+from dataset.generators.moral_consistency import MoralConsistencyGenerator, scenario_table
 from dataset.generators.industry_facts import IndustryFactsGenerator
 from dataset.generators.euphemism_correction import EuphemismCorrectionGenerator
 from dataset.generators.nutrition_accuracy import NutritionAccuracyGenerator
@@ -76,6 +80,154 @@ class TestExample:
         assert "uid" in d
         assert len(d["uid"]) == 16
 
+    def test_to_dict_matches_fields(self):
+        ex = Example(
+            instruction="test", input="", output="test",
+            category="test", subcategory="test", citations=("FAO (2023)",), tags=("scale",),
+        )
+        d = ex.to_dict()
+        assert list(d) == [f.name for f in dataclasses.fields(Example)] + ["uid"]
+        assert d["citations"] == ["FAO (2023)"]
+
+    def test_example_is_frozen_and_slotted(self):
+        ex = Example(
+            instruction="test", input="", output="test",
+            category="test", subcategory="test",
+        )
+        assert not hasattr(ex, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            ex.output = "changed"
+
+    def test_pickle_round_trip(self):
+        examples = SentienceScienceGenerator(seed=42).generate_all()
+        assert pickle.loads(pickle.dumps(examples)) == examples
+
+    def test_citations_and_tags_are_tuples(self):
+        ex = Example(
+            instruction="test", input="", output="test",
+            category="test", subcategory="test",
+        )
+        assert ex.citations == () and ex.tags == ()
+        gen = IndustryFactsGenerator(seed=42)
+        made = gen._make_example("Q?", "A.", "test", citations=["FAO (2023)"], tags=["scale"])
+        assert made.citations == ("FAO (2023)",)
+        assert made.tags == ("scale",)
+        hash(made)  # tuple fields make examples hashable
+
+
+class TestBaseGenerator:
+    """Tests for shared BaseGenerator behaviour."""
+
+    def test_generate_all_is_cached_per_instance(self):
+        gen = SentienceScienceGenerator(seed=42)
+        first = gen.generate_all()
+        second = gen.generate_all()
+        assert first == second
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second))
+        assert SentienceScienceGenerator(seed=42).generate_all() == first
+
+    def test_generate_all_uses_instance_state(self):
+        class PrefixGenerator(BaseGenerator):
+            category = "test"
+
+            def __init__(self, prefix: str, seed: int = 42):
+                super().__init__(seed=seed)
+                self.prefix = prefix
+
+            def generate(self):
+                yield self._make_example(f"{self.prefix} Q?", "A.", "test")
+
+        gen = PrefixGenerator("first")
+        gen.prefix = "patched"
+        assert gen.generate_all()[0].instruction == "patched Q?"
+        assert PrefixGenerator("other").generate_all()[0].instruction == "other Q?"
+
+    def test_generate_all_matches_generate(self):
+        gen = SentienceScienceGenerator(seed=7)
+        assert gen.generate_all() == list(SentienceScienceGenerator(seed=7).generate())
+
+    def test_examples_sequence(self):
+        gen = SentienceScienceGenerator(seed=42)
+        examples = gen.generate_all()
+        assert gen.examples() == tuple(examples)
+        assert gen.examples() is gen.examples()
+        assert gen.examples()[3] is examples[3]
+
+    def test_ids_by_tag_prefix(self):
+        gen = IndustryFactsGenerator(seed=42)
+        examples = gen.generate_all()
+        ids = gen.ids_by_tag_prefix("egg_")
+        assert ids
+        assert ids == sorted(
+            i for i, ex in enumerate(examples) if any(t.startswith("egg_") for t in ex.tags)
+        )
+        assert gen.ids_by_tag_prefix("no_such_tag") == []
+
+    def test_fact_bank_normalizes_records(self):
+        bank = fact_bank("scale", [
+            {"q": "Q1?", "a": "A1.", "tags": ["scale"]},
+            {"q": "Q2?", "a": "A2.", "subcategory": "health", "citations": ["FAO (2023)"]},
+        ])
+        assert bank[0].subcategory == "scale"
+        assert bank[0].citations == ()
+        assert bank[0].tags == ("scale",)
+        assert bank[1].subcategory == "health"
+        assert bank[1].citations == ("FAO (2023)",)
+
+    def test_equal_tag_tuples_are_shared(self):
+        assert canonical_tags(["scale", "fish"]) is canonical_tags(("scale", "fish"))
+        bank = fact_bank("scale", [
+            {"q": "Q1?", "a": "A1.", "tags": ["scale", "fish"]},
+            {"q": "Q2?", "a": "A2.", "tags": ["scale", "fish"]},
+        ])
+        assert bank[0].tags is bank[1].tags
+
+    def test_merge_banks_drops_duplicate_questions(self):
+        first = fact_bank("scale", [{"q": "How many?", "a": "Many."}])
+        second = fact_bank("health", [
+            {"q": "how  many?", "a": "Still many."},
+            {"q": "Why?", "a": "Because."},
+        ])
+        with pytest.warns(UserWarning, match="Duplicate fact question"):
+            merged = merge_banks(first, second)
+        assert [f.a for f in merged] == ["Many.", "Because."]
+
+    def test_fact_bank_rejects_split_answer(self):
+        with pytest.raises(TypeError):
+            fact_bank("scale", [{"q": "Q?", "a": ("First half. ", "second half.")}])
+
+    def test_save_compressed(self, tmp_path):
+        pytest.importorskip("zstandard")
+        from dataset.generators.base import open_jsonl
+
+        gen = SentienceScienceGenerator(seed=42)
+        output_path = gen.save(tmp_path, compress=True)
+        assert output_path.name == "sentience_science.jsonl.zst"
+        with open_jsonl(output_path) as f:
+            lines = [json.loads(line) for line in f]
+        assert len(lines) == len(gen.generate_all())
+        assert lines[0]["instruction"] == gen.generate_all()[0].instruction
+
+    def test_save_replaces_other_format(self, tmp_path):
+        pytest.importorskip("zstandard")
+        gen = SentienceScienceGenerator(seed=42)
+        plain = gen.save(tmp_path)
+        compressed = gen.save(tmp_path, compress=True)
+        assert compressed.exists() and not plain.exists()
+        gen.save(tmp_path)
+        assert plain.exists() and not compressed.exists()
+
+    def test_save_arrow_round_trip(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        from dataset.formatting.arrow_format import read_arrow
+
+        gen = SentienceScienceGenerator(seed=42)
+        table = read_arrow(gen.save_arrow(tmp_path))
+        examples = gen.generate_all()
+        assert table.num_rows == len(examples)
+        assert table.column("uid").to_pylist() == [ex.uid for ex in examples]
+
 
 class TestSentienceScienceGenerator:
     """Tests for the sentience science generator."""
@@ -157,6 +309,43 @@ class TestMoralConsistencyGenerator:
             if "scenario_pair" in ex.subcategory:
                 assert "yes" in ex.output.lower() or "wrong" in ex.output.lower() or "harmful" in ex.output.lower()
 
+    def test_scenario_table_flattens_variants(self):
+        table = MoralConsistencyGenerator.PHYSICAL_MODIFICATION_SCENARIOS
+        assert table.species[:2] == ("dog", "pig")
+        assert table.body_parts[-1] == "testicles"
+        assert table.scenarios[0] == "cutting off a dog's tail without anesthesia"
+        assert len(table.species) == len(table.sciences) == len(table.industry_contexts)
+        assert not any(ctx.startswith(" ") for ctx in table.industry_contexts)
+
+    def test_class_tables_are_read_only(self):
+        with pytest.raises(TypeError):
+            MoralConsistencyGenerator.SPECIES_SCIENCE["pig"] = "changed"
+        assert isinstance(MoralConsistencyGenerator.CONSISTENCY_TEMPLATES, tuple)
+        assert isinstance(MoralConsistencyGenerator.DIRECT_PAIRS, tuple)
+        pair_set = MoralConsistencyGenerator.DIRECT_PAIRS[0]
+        with pytest.raises(TypeError):
+            pair_set["q_template"] = "changed"
+        with pytest.raises(TypeError):
+            pair_set["action_pairs"][0]["answer"] = "changed"
+        with pytest.raises(AttributeError):
+            pair_set["action_pairs"].append({})
+        with pytest.raises(AttributeError):
+            MoralConsistencyGenerator.CONSISTENCY_TEMPLATES[1]["actions"].append("x {species}")
+
+    def test_scenario_table_rejects_malformed_variants(self):
+        variant = {"industry_context": "", "common_view": "harmful", "science": ("a", "b")}
+        with pytest.raises(TypeError, match="science"):
+            scenario_table({"base_scenario": "x {species}", "species_variants": {"dog": variant}})
+        del variant["science"]
+        with pytest.raises(ValueError, match="missing field 'science'"):
+            scenario_table({"base_scenario": "x {species}", "species_variants": {"dog": variant}})
+        variant["science"] = "ok"
+        with pytest.raises(ValueError, match="body_part"):
+            scenario_table({
+                "base_scenario": "cutting a {species}'s {body_part}",
+                "species_variants": {"dog": variant},
+            })
+
 
 class TestIndustryFactsGenerator:
     """Tests for the industry facts generator."""
@@ -172,6 +361,38 @@ class TestIndustryFactsGenerator:
         cited = [ex for ex in examples if ex.citations]
         assert len(cited) > 5
 
+    def test_lifespan_table_matches_species(self):
+        pytest.importorskip("numpy")
+        from dataset.generators.industry_facts import (
+            LIFESPAN_COLUMNS,
+            LIFESPAN_SPECIES,
+            lifespan_table,
+        )
+
+        table = lifespan_table()
+        assert table.shape == (len(LIFESPAN_SPECIES), len(LIFESPAN_COLUMNS))
+        broiler = table[LIFESPAN_SPECIES.index("broiler_chicken")]
+        assert 0.014 < broiler[4] < broiler[5] < 0.024
+
+    def test_lifespan_table_matches_answer(self):
+        pytest.importorskip("numpy")
+        from dataset.generators.industry_facts import ADDITIONAL_QUESTIONS, lifespan_table
+
+        answer = next(f.a for f in ADDITIONAL_QUESTIONS if f.q.startswith("How long do farmed"))
+        # Answer labels, in LIFESPAN_SPECIES order.
+        labels = (
+            "Broiler chickens:", "Pigs:", "Beef cattle:", "Dairy cows:",
+            "Egg-laying hens:", "Veal calves:", "Lambs:", "Turkeys:", "In every case",
+        )
+
+        def pct(fraction):
+            return f"{fraction * 100:.1f}".removesuffix(".0")
+
+        for i, row in enumerate(lifespan_table()):
+            segment = answer[answer.index(labels[i]):answer.index(labels[i + 1])]
+            assert f"natural lifespan {int(row[2])}" in segment
+            assert f"{pct(row[4])}-{pct(row[5])}%" in segment, segment
+
 
 class TestEuphemismCorrectionGenerator:
     """Tests for the euphemism correction generator."""
@@ -275,3 +496,36 @@ class TestAllGenerators:
                 assert phrase not in ex.output.lower(), (
                     f"Preachy phrase '{phrase}' found in {generator_cls.__name__}: {ex.instruction}"
                 )
+
+    def test_shared_citations_have_one_spelling(self):
+        from dataset.generators import ALL_GENERATORS, citations
+
+        shared = {v for k, v in vars(citations).items() if k.isupper()}
+        # "Author (year" identifies a reference regardless of its title text.
+        keys = {c.split(")")[0] for c in shared}
+        for generator_cls in ALL_GENERATORS:
+            for ex in generator_cls(seed=42).generate_all():
+                for c in ex.citations:
+                    if c.split(")")[0] in keys:
+                        assert c in shared, f"{generator_cls.__name__}: {c}"
+
+
+class TestGenerateCli:
+    """Tests for the `generate` command."""
+
+    def test_parallel_matches_sequential(self, tmp_path):
+        runner = CliRunner()
+        outputs = {}
+        for workers in ("1", "2"):
+            out = tmp_path / f"j{workers}"
+            result = runner.invoke(cli.main, ["generate", "-o", str(out), "-j", workers])
+            assert result.exit_code == 0, result.output
+            outputs[workers] = {p.name: p.read_text() for p in sorted(out.glob("*.jsonl"))}
+        assert len(outputs["1"]) == 6
+        assert outputs["2"] == outputs["1"]
+
+    @pytest.mark.parametrize("workers", ["0", "-3"])
+    def test_rejects_non_positive_workers(self, tmp_path, workers):
+        result = CliRunner().invoke(cli.main, ["generate", "-o", str(tmp_path), "-j", workers])
+        assert result.exit_code != 0
+        assert "--workers" in result.output